@@ -0,0 +1,91 @@
+import asyncio
+import hashlib
+import random
+from pathlib import Path
+
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+# Local stand-in for ua.kinorium.com. Serves the film list handler, search and film pages
+# from the templates in fixtures/, with an optional artificial latency per response.
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+FILM_LIST_ITEM = _fixture("film_list_item.html")
+SEARCH_PAGE = _fixture("search.html")
+SEARCH_ITEM = _fixture("search_item.html")
+FILM_PAGE = _fixture("film.html")
+CAST_ITEM = _fixture("cast_item.html")
+
+
+def _film_id(value: str) -> int:
+    return int(hashlib.md5(value.encode("utf-8")).hexdigest()[:6], 16)
+
+
+def create_app(latency_ms: float = 0.0, films_per_genre: int = 500) -> FastAPI:
+    app = FastAPI()
+
+    async def simulate_latency():
+        if latency_ms:
+            # +-20% jitter around the configured latency
+            await asyncio.sleep(latency_ms / 1000 * random.uniform(0.8, 1.2))
+
+    @app.get("/handlers/filmList/")
+    async def film_list(request: Request, page: int = 1, perpage: int = 50):
+        await simulate_latency()
+        genre = request.query_params.get("genres[]", "0")
+
+        start = (page - 1) * perpage
+        end = min(start + perpage, films_per_genre)
+        items = [
+            FILM_LIST_ITEM.format(
+                film_id=int(genre) * 100000 + i,
+                title=f"Фільм {genre}-{i}",
+                year=1980 + i % 45,
+                rating=f"{5 + i % 5}.{i % 10}",
+            )
+            for i in range(start, end)
+        ]
+        return JSONResponse({"result": {"html": "".join(items)}})
+
+    @app.get("/search/", response_class=HTMLResponse)
+    async def search(q: str = Query(...)):
+        await simulate_latency()
+        results = "" if "notfound" in q else SEARCH_ITEM.format(film_id=_film_id(q), title=q, year=2014)
+        return SEARCH_PAGE.format(query=q, results=results)
+
+    @app.get("/{film_id}/", response_class=HTMLResponse)
+    async def film(request: Request, film_id: int):
+        await simulate_latency()
+        cast = "".join(CAST_ITEM.format(actor_id=film_id * 100 + i) for i in range(25))
+        body = FILM_PAGE.format(
+            title=f"Фільм {film_id}",
+            original_title=f"Film {film_id}",
+            year=1980 + film_id % 45,
+            rating=f"{5 + film_id % 5}.{film_id % 10}",
+            cast=cast,
+        )
+        # film pages never change here, so conditional requests always get 304
+        etag = f'"{hashlib.md5(body.encode("utf-8")).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return HTMLResponse(body, headers={"ETag": etag})
+
+    return app
+
+
+if __name__ == "__main__":
+    import argparse
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Local Kinorium stand-in server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(latency_ms=args.latency_ms), host="127.0.0.1", port=args.port)
@@ -0,0 +1,199 @@
+"""Offline benchmark harness.
+
+Starts the local Kinorium stand-in (benchmarks/fixture_server.py), points the scraper at it
+through KINORIUM_BASE_URL and runs repeatable scenarios. Results are printed as JSON:
+throughput plus p50/p95/p99 latency per scenario.
+
+    python -m benchmarks.run --scenarios http_genre_pages storage_churn --iterations 500
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = ("http_genre_pages", "headless_details", "mixed_load", "storage_churn")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _summary(name: str, latencies: list[float], errors: int, duration: float, **extra) -> dict:
+    ops = len(latencies) + errors
+    summary = {
+        "scenario": name,
+        "ops": ops,
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "throughput_ops_s": round(ops / duration, 2) if duration else None,
+        **extra,
+    }
+    if len(latencies) >= 2:
+        q = statistics.quantiles(latencies, n=100, method="inclusive")
+        summary.update({
+            "p50_ms": round(q[49] * 1000, 3),
+            "p95_ms": round(q[94] * 1000, 3),
+            "p99_ms": round(q[98] * 1000, 3),
+            "max_ms": round(max(latencies) * 1000, 3),
+        })
+    return summary
+
+
+async def measure(name: str, iterations: int, concurrency: int, op: Callable[[int], Awaitable], **extra) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def run_one(i: int):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await op(i)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run_one(i) for i in range(iterations)))
+    return _summary(name, latencies, errors, time.perf_counter() - started, concurrency=concurrency, **extra)
+
+
+async def run_benchmarks(args) -> list[dict]:
+    # imported here: the config has to see KINORIUM_BASE_URL first
+    import uvicorn
+    from benchmarks.fixture_server import create_app
+    from src.config.scraping import scraping_config, GENRES_MAP
+    from src.database import mem_db
+    from src.scraping.http_client import http_client
+    from src.scraping.parsers.http_parser import KinoriumHttpParser
+    from src.scraping.parsers.details_parser import KinoriumDetailsParser
+    from src.scraping.parsers.headless_parser import KinoriumHeadlessParser
+    from src.scraping.schemas import ScrapeRequest, ScrapingMode, TaskStatus
+    from src.scraping.services.cache import result_cache
+    from src.scraping.services.scraping_service import ScrapingService
+    from src.scraping.services.task_queue import task_queue
+    from src.utils.rate_limiter import rate_limiter
+
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(latency_ms=args.latency_ms), host="127.0.0.1", port=args.port, log_level="warning",
+    ))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    # measure the scraper, not the caches or the politeness limits
+    result_cache.enabled = False
+    if not args.rate_limit:
+        rate_limiter.configure(scraping_config.base_url, rate=1e9, burst=10**9, max_in_flight=10**6)
+
+    genres = list(GENRES_MAP)
+    results = []
+    try:
+        if "http_genre_pages" in args.scenarios:
+            parser = KinoriumHttpParser()
+            results.append(await measure(
+                "http_genre_pages", args.iterations, args.concurrency,
+                lambda i: parser.parse(genres[i % len(genres)], page=1 + i % 10, perpage=50),
+                html_backend=parser.html_backend.name,
+            ))
+
+        if "headless_details" in args.scenarios:
+            details_parser = KinoriumHeadlessParser() if args.headless_browser else KinoriumDetailsParser()
+            results.append(await measure(
+                "headless_details", args.iterations, args.concurrency,
+                lambda i: details_parser.parse(f"film {uuid.uuid4().hex}"),
+                browser=args.headless_browser,
+            ))
+
+        if "mixed_load" in args.scenarios:
+            await task_queue.start()
+            service = ScrapingService()
+
+            async def scrape_and_wait(i: int):
+                if i % 4 == 0:
+                    request = ScrapeRequest(query=f"film {uuid.uuid4().hex}", mode=ScrapingMode.headless)
+                else:
+                    request = ScrapeRequest(query=genres[i % len(genres)], mode=ScrapingMode.http)
+                response = await service.start(request)
+                while True:
+                    task = await mem_db.get_task(response.task_id)
+                    if task and task["status"] in (TaskStatus.completed, TaskStatus.failed):
+                        if task["status"] == TaskStatus.failed:
+                            raise RuntimeError(task.get("error_message"))
+                        return
+                    await asyncio.sleep(0.005)
+
+            results.append(await measure("mixed_load", args.iterations, args.concurrency, scrape_and_wait))
+            await task_queue.stop()
+
+        if "storage_churn" in args.scenarios:
+            async def churn(i: int):
+                task_id = f"http_{uuid.uuid4()}"
+                await mem_db.save_task(task_id, {
+                    "task_id": task_id, "status": TaskStatus.pending, "mode": ScrapingMode.http, "query": "драма",
+                })
+                await mem_db.update_task_status(task_id, TaskStatus.in_progress)
+                await mem_db.update_task_status(task_id, TaskStatus.completed, result=[
+                    {"title": f"Фільм {n}", "link": f"https://ua.kinorium.com/{n}/"} for n in range(50)
+                ])
+                await mem_db.get_task(task_id)
+
+            results.append(await measure("storage_churn", args.iterations, args.concurrency, churn))
+    finally:
+        await http_client.close()
+        server.should_exit = True
+        await server_task
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline scraper benchmarks against a local Kinorium stand-in")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="artificial latency of the fixture server")
+    parser.add_argument("--port", type=int, default=0, help="fixture server port (default: random free port)")
+    parser.add_argument("--headless-browser", action="store_true", help="force the Playwright path for details")
+    parser.add_argument("--rate-limit", action="store_true", help="keep the configured outbound rate limits")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    args.port = args.port or _free_port()
+    os.environ["KINORIUM_BASE_URL"] = f"http://127.0.0.1:{args.port}"
+
+    # storage/ and the sqlite files are created relative to cwd, keep them out of the repo
+    sys.path.insert(0, str(REPO_ROOT))
+    workdir = tempfile.mkdtemp(prefix="scraper-bench-")
+    os.chdir(workdir)
+
+    report = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "latency_ms": args.latency_ms,
+        "iterations": args.iterations,
+        "results": asyncio.run(run_benchmarks(args)),
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import json
 import time
 import requests
 import webbrowser
@@ -19,31 +20,35 @@ def print_separator():
 
 def poll_task_status(task_id):
     print(f"[OK] Задача створена! ID: {task_id}")
-    print("Очікування результату (оновлення кожні 1 сек)...")
+    print("Очікування результату (сервер надсилає зміни статусу)...")
     
     start_time = time.time()
     
-    while True:
-        time.sleep(1)
-        elapsed = int(time.time() - start_time)
-        
-        try:
-            status_resp = requests.get(f"{BASE_URL}/scrape/{task_id}")
-            status_resp.raise_for_status()
-            task_info = status_resp.json()
-        except Exception as e:
-            print(f"[ERROR] Помилка з'єднання: {e}")
-            continue
-
-        status = task_info["status"]
-        print(f"   [{elapsed}s] Статус: {status}")
-
-        if status == "completed":
-            return task_info.get("result")
-        
-        elif status == "failed":
-            print(f"\n[FAIL] ПОМИЛКА СЕРВЕРА: {task_info.get('error_message')}")
-            return None
+    try:
+        with requests.get(f"{BASE_URL}/scrape/events", params={"task_id": task_id}, stream=True) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+
+                task_info = json.loads(line[len("data: "):])
+                status = task_info.get("status")
+                if status is None:
+                    continue
+
+                elapsed = int(time.time() - start_time)
+                print(f"   [{elapsed}s] Статус: {status}")
+
+                if status == "completed":
+                    return task_info.get("result")
+                
+                elif status == "failed":
+                    print(f"\n[FAIL] ПОМИЛКА СЕРВЕРА: {task_info.get('error_message')}")
+                    return None
+    except Exception as e:
+        print(f"[ERROR] Помилка з'єднання: {e}")
+
+    return None
 
 def run_genre_scraping():
     print("\n--- ПОШУК ЗА ЖАНРОМ ---")
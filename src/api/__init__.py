@@ -2,11 +2,13 @@ from fastapi import APIRouter
 
 from src.api.health import router as health_router
 from src.api.scrape import router as scrape_router
+from src.api.metrics import router as metrics_router
 
 main_router = APIRouter()
 
 main_router.include_router(health_router)
 main_router.include_router(scrape_router)
+main_router.include_router(metrics_router)
 
 
 # icludes routers at initialization
\ No newline at end of file
@@ -0,0 +1,50 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.database.hot_state import HotStateTaskStore
+from src.database.mem_db import task_store
+from src.scraping.browser_pool import browser_pool
+from src.scraping.services.cache import result_cache
+from src.scraping.services.task_queue import task_queue
+from src.utils.metrics import registry
+from src.utils.rate_limiter import rate_limiter
+
+router = APIRouter(tags=["metrics"])
+
+
+registry.gauge(
+    "scraper_queue_depth", "Tasks waiting in the worker queue", ("mode",),
+    lambda: {(mode,): s["queued"] for mode, s in task_queue.stats().items()},
+)
+registry.gauge(
+    "scraper_tasks_in_flight", "Tasks currently being scraped by workers", ("mode",),
+    lambda: {(mode,): s["in_flight"] for mode, s in task_queue.stats().items()},
+)
+registry.gauge(
+    "scraper_browser_pool", "Browser pool size and leased contexts", ("kind",),
+    lambda: {(kind,): value for kind, value in browser_pool.stats().items()},
+)
+registry.gauge(
+    "scraper_cache_hit_ratio", "Result cache hit ratio since start", (),
+    lambda: {(): result_cache.stats()["hit_ratio"]},
+)
+registry.gauge(
+    "scraper_cache_entries", "Entries in the in-memory result cache", (),
+    lambda: {(): result_cache.stats()["entries"]},
+)
+registry.gauge(
+    "scraper_rate_limit_per_second", "Current outbound request rate per host", ("host",),
+    lambda: {(host,): s["rate"] for host, s in rate_limiter.stats().items()},
+)
+
+if isinstance(task_store, HotStateTaskStore):
+    registry.gauge(
+        "scraper_hot_tasks", "Active tasks held in memory and not yet persisted", (),
+        lambda: {(): task_store.stats()["active"]},
+    )
+
+
+# Prometheus text exposition format
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -1,13 +1,32 @@
-from fastapi import APIRouter, HTTPException, Depends
-from src.scraping.schemas import ScrapeRequest, ScrapeResponse
-from src.scraping.services.scraping_service import ScrapingService
+import json
+import logging
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
+from src.scraping.schemas import (
+    ScrapeRequest, ScrapeResponse, BatchScrapeRequest, BatchScrapeResponse, CrawlRequest,
+    ScrapingMode, TaskStatus, TaskListResponse,
+)
+from src.scraping.services.scraping_service import ScrapingService, scraping_service
+from src.scraping.services.batch_service import BatchService, batch_service
+from src.scraping.services.crawl_service import CrawlService, crawl_service
+from src.scraping.services.status_stream import stream_task_events
+from src.scraping.services.task_queue import QueueFullError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["scrape"])
 
 
-# Dependency to get the scraping service
+# Dependencies return the process-wide services, nothing is built per request
 def get_scraping_service():
-    return ScrapingService()
+    return scraping_service
+
+def get_batch_service():
+    return batch_service
+
+def get_crawl_service():
+    return crawl_service
 
 # Endpoint to start a new scraping task
 @router.post("/scrape", response_model=ScrapeResponse)
@@ -18,11 +37,97 @@ async def scrape_data(
 ):
     try:
         return await service.start(request)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error starting scraping task: {str(e)}")
 
+# Endpoint to list tasks, newest first, with filters and cursor pagination
+@router.get("/scrape", response_model=TaskListResponse)
+async def list_scrape_tasks(
+    mode: ScrapingMode | None = None,
+    status: TaskStatus | None = None,
+    query_prefix: str | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    service: ScrapingService = Depends(get_scraping_service)
+):
+    try:
+        return await service.list_tasks(
+            mode=mode,
+            status=status,
+            query_prefix=query_prefix,
+            created_after=created_after,
+            created_before=created_before,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# Endpoint to start many scraping tasks at once
+@router.post("/scrape/batch", response_model=BatchScrapeResponse)
+async def scrape_batch(
+    batch: BatchScrapeRequest,
+    service: BatchService = Depends(get_batch_service)
+):
+    try:
+        return await service.start(batch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error starting batch: {str(e)}")
+
+# Endpoint to get batch progress (per-item results only when include_results=true)
+@router.get("/scrape/batch/{batch_id}", response_model=BatchScrapeResponse)
+async def get_batch_status(
+    batch_id: str,
+    include_results: bool = False,
+    service: BatchService = Depends(get_batch_service)
+):
+    batch = await service.get_status(batch_id, include_results=include_results)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return batch
+
+# Endpoint to crawl every page of a genre (or all genres), streamed as NDJSON
+@router.post("/scrape/crawl")
+async def crawl_genres(
+    request: CrawlRequest,
+    service: CrawlService = Depends(get_crawl_service)
+):
+    try:
+        service.resolve_genres(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def ndjson():
+        try:
+            async for movie in service.crawl(request):
+                yield movie.model_dump_json() + "\n"
+        except Exception as e:
+            # headers are already sent, so report the failure as the last line
+            logger.warning(f"Crawl interrupted: {str(e)}")
+            yield json.dumps({"error": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+# Endpoint to follow task status changes as server-sent events (?task_id=a&task_id=b)
+@router.get("/scrape/events")
+async def scrape_events(
+    task_id: list[str] = Query(...),
+    service: ScrapingService = Depends(get_scraping_service)
+):
+    return StreamingResponse(
+        stream_task_events(service, task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 # Endpoint to get scraping task status
 @router.get("/scrape/{task_id}", response_model=ScrapeResponse)
 async def get_scrape_status(
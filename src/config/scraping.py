@@ -1,9 +1,11 @@
+import os
 from dataclasses import dataclass
 
 
 @dataclass(frozen=True)
 class ScrapingConfig:
-    base_url: str = "https://ua.kinorium.com"
+    # KINORIUM_BASE_URL points the scraper at another host (e.g. the benchmark fixture server)
+    base_url: str = os.getenv("KINORIUM_BASE_URL", "https://ua.kinorium.com")
 
     request_timeout: float = 20.0
     user_agent: str = (
@@ -12,6 +14,92 @@ class ScrapingConfig:
         "Chrome/120.0.0.0 Safari/537.36"
     )
 
+    # --- Outbound rate limiting (per target host) ---
+    rate_limit_per_second: float = 5.0
+    rate_limit_burst: int = 10
+    max_in_flight_per_host: int = 8
+    rate_limit_min_per_second: float = 0.5
+    rate_limit_backoff_factor: float = 0.5 # rate multiplier after a 429/503
+    rate_limit_recovery_step: float = 0.05 # share of the base rate regained per successful response
+
+    # --- Retries and circuit breaker ---
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 5.0
+    breaker_failure_threshold: int = 5 # transient upstream failures in a row
+    breaker_reset_timeout: float = 30.0 # seconds before a trial call is let through
+
+    # --- Startup warm-up ---
+    # modes prepared at startup (parsers built, pools opened); browsers are only launched for
+    # headless/ui, so SCRAPER_WARMUP_MODES=http keeps playwright out of the process
+    warmup_modes: tuple[str, ...] = tuple(
+        m.strip() for m in os.getenv("SCRAPER_WARMUP_MODES", "http,headless,ui").split(",") if m.strip()
+    )
+
+    # --- Task queue ---
+    http_workers: int = 8
+    headless_workers: int = 4
+    ui_workers: int = 2
+    queue_max_size: int = 100 # per mode, new tasks are rejected when full
+    queue_low_max_size: int = 60 # low priority jobs only fill the queue up to here, the rest is kept for high/normal
+    # weighted fair queuing inside each mode: share of worker time per priority under load
+    priority_weight_high: float = 8.0
+    priority_weight_normal: float = 4.0
+    priority_weight_low: float = 1.0
+
+    # --- Batch scraping ---
+    batch_max_items: int = 1000
+    batch_concurrency: int = 8 # items of one batch scraped at the same time
+
+    # --- Movie details (headless) ---
+    details_http_fast_path: bool = True # try plain HTTP first, launch a browser only if fields are missing
+    # conditional GET against the stored fingerprint of a film page, re-extract only when it changed
+    details_revalidate: bool = True
+    details_fingerprint_path: str | None = "storage/details.db"
+    details_fingerprint_ttl: float = 180 * 24 * 60 * 60
+
+    # --- Watchlist refresher (headless) ---
+    # file with one title per line, re-scraped every interval to keep the result cache fresh
+    watchlist_path: str | None = os.getenv("SCRAPER_WATCHLIST")
+    watchlist_refresh_interval: float = 12 * 60 * 60 # keep below cache_ttl_headless
+    watchlist_concurrency: int = 4
+
+    # --- Title -> film URL cache (headless / ui) ---
+    url_cache_path: str | None = "storage/url_cache.db" # None disables the cache
+    url_cache_ttl: float = 30 * 24 * 60 * 60
+    url_cache_negative_ttl: float = 6 * 60 * 60 # how long "Movie not found" is remembered
+
+    # --- Film list HTML parsing (http) ---
+    html_parser_backend: str = "lxml" # "lxml", "selectolax" or "bs4"
+    parse_executor: str = "process" # "process", "thread" or "inline" (on the event loop)
+    parse_workers: int | None = None # defaults to the CPU count
+    parse_inline_max_bytes: int = 8 * 1024 # smaller documents skip the executor round trip
+
+    # --- Genre crawl (http) ---
+    crawl_perpage: int = 50
+    crawl_max_pages: int = 200 # per genre
+    crawl_concurrency: int = 4 # pages fetched at the same time
+
+    # --- Result cache ---
+    cache_enabled: bool = True
+    cache_max_entries: int = 1000
+    cache_ttl_http: float = 60 * 60 # genre lists change more often than movie details
+    cache_ttl_headless: float = 24 * 60 * 60
+    cache_ttl_ui: float = 0 # ui mode opens a browser, never serve it from cache
+    cache_persistent_path: str | None = None # e.g. "storage/cache.db" to keep results across restarts
+
+    # --- Shared HTTP client (http) ---
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = True
+
+    # --- Browser pool (headless / ui) ---
+    browser_pool_size: int = 2
+    browser_contexts_per_browser: int = 4
+    browser_max_pages: int = 100 # relaunch a browser after serving this many pages
+    browser_health_check_interval: float = 30.0
+
 
 scraping_config = ScrapingConfig()
 
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StorageConfig:
+    backend: str = "sqlite" # "sqlite" or "json" (legacy file-per-task layout)
+
+    data_dir: str = "storage"
+    sqlite_path: str = "storage/tasks.db"
+    # keep active tasks in memory and only persist their final state
+    hot_state_enabled: bool = True
+
+    # --- Payload encoding ---
+    serializer: str = "orjson" # "json", "orjson" or "msgpack"
+    compression: str = "zstd" # "none", "gzip" or "zstd"
+    compress_min_bytes: int = 2048 # smaller payloads are stored uncompressed
+
+    # --- Retention ---
+    retention_enabled: bool = True
+    sweep_interval: float = 10 * 60
+    ttl_http: float = 7 * 24 * 60 * 60
+    ttl_headless: float = 30 * 24 * 60 * 60
+    ttl_ui: float = 24 * 60 * 60
+    ttl_batch: float = 7 * 24 * 60 * 60
+    max_tasks: int | None = 100_000 # oldest tasks are removed above this
+    max_bytes: int | None = None
+
+    # completed tasks reaching their mode's TTL are moved into gzip'd JSONL files instead of
+    # being deleted; archive_after moves them out earlier (GET /scrape/{id} then returns 404)
+    archive_enabled: bool = True
+    archive_after: float | None = None
+    archive_dir: str = "storage/archive"
+    archive_ttl: float = 90 * 24 * 60 * 60
+
+
+storage_config = StorageConfig()
@@ -0,0 +1,93 @@
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+# Filters for TaskStore.list_tasks. Results are ordered newest first (oldest first with
+# `oldest_first`); `cursor` is the (created_at, task_id) of the last task of the previous page.
+@dataclass
+class TaskQuery:
+    modes: list[str] | None = None
+    statuses: list[str] | None = None
+    query_prefix: str | None = None
+    created_after: float | None = None
+    created_before: float | None = None
+    cursor: tuple[float, str] | None = None
+    limit: int = 100
+    oldest_first: bool = False
+
+    def matches(self, task: dict) -> bool:
+        created_at = task.get("created_at", 0)
+        if self.modes and task.get("mode") not in self.modes:
+            return False
+        if self.statuses and task.get("status") not in self.statuses:
+            return False
+        if self.query_prefix and not (task.get("query") or "").startswith(self.query_prefix):
+            return False
+        if self.created_after is not None and created_at < self.created_after:
+            return False
+        if self.created_before is not None and created_at >= self.created_before:
+            return False
+        if self.cursor is not None:
+            key = (created_at, task["task_id"])
+            if (key <= self.cursor) if self.oldest_first else (key >= self.cursor):
+                return False
+        return True
+
+
+# Common interface for task storage backends
+class TaskStore(ABC):
+
+    @abstractmethod
+    async def save_task(self, task_id: str, task_data: dict) -> None:
+        ...
+
+    @abstractmethod
+    async def get_task(self, task_id: str) -> dict | None:
+        ...
+
+    async def get_tasks(self, task_ids: list[str]) -> dict[str, dict]:
+        # backends that can do better than one read per id override this
+        tasks = await asyncio.gather(*(self.get_task(task_id) for task_id in task_ids))
+        return {task["task_id"]: task for task in tasks if task}
+
+    @abstractmethod
+    async def update_task_status(self, task_id: str, status: str, result=None, error_message=None, **fields) -> None:
+        # `fields` are extra top-level keys merged into the task record (e.g. attempts)
+        ...
+
+    @abstractmethod
+    async def list_tasks(self, query: TaskQuery) -> list[dict]:
+        ...
+
+    @abstractmethod
+    async def delete_tasks(self, task_ids: list[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def count_tasks(self) -> int:
+        ...
+
+    @abstractmethod
+    async def storage_bytes(self) -> int:
+        ...
+
+    async def compact(self) -> None:
+        # give freed space back to the OS after deletions, if the backend can
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+def json_serializer(obj):
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    if hasattr(obj, 'dict'):
+        return obj.dict()
+    return str(obj)
+
+
+def plain(value):
+    # enums (ScrapingMode, TaskStatus) -> their raw value
+    return getattr(value, "value", value)
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+
+from src.database.base import TaskStore, TaskQuery, plain
+from src.database.task_events import TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+
+# Write-back layer in front of the durable store. Active tasks live only in memory, so
+# status polls and intermediate updates never touch disk. A task is written to the backing
+# store once, when it reaches a terminal status. Tasks still active at shutdown are
+# flushed by close(). Updates to a single task are serialized by a per-task lock.
+class HotStateTaskStore(TaskStore):
+
+    def __init__(self, store: TaskStore):
+        self.store = store
+        self._active: dict[str, dict] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _lock(self, task_id: str) -> asyncio.Lock:
+        return self._locks.setdefault(task_id, asyncio.Lock())
+
+    async def _flush(self, task_id: str, task: dict) -> None:
+        await self.store.save_task(task_id, task)
+        self._active.pop(task_id, None)
+        self._locks.pop(task_id, None)
+
+    async def save_task(self, task_id: str, task_data: dict) -> None:
+        task = dict(task_data)
+        task.setdefault("created_at", time.time())
+        async with self._lock(task_id):
+            if plain(task.get("status")) in TERMINAL_STATUSES:
+                await self._flush(task_id, task)
+            else:
+                self._active[task_id] = task
+
+    async def get_task(self, task_id: str) -> dict | None:
+        task = self._active.get(task_id)
+        if task is not None:
+            return dict(task)
+        return await self.store.get_task(task_id)
+
+    async def get_tasks(self, task_ids: list[str]) -> dict[str, dict]:
+        tasks = {task_id: dict(self._active[task_id]) for task_id in task_ids if task_id in self._active}
+        missing = [task_id for task_id in task_ids if task_id not in tasks]
+        if missing:
+            tasks.update(await self.store.get_tasks(missing))
+        return tasks
+
+    async def update_task_status(self, task_id: str, status: str, result=None, error_message=None, **fields) -> None:
+        # not tracked in memory (already final, or created before a restart), no lock needed
+        if task_id not in self._active:
+            await self.store.update_task_status(task_id, status, result=result, error_message=error_message, **fields)
+            return
+
+        async with self._lock(task_id):
+            task = self._active.get(task_id)
+            if task is None:
+                # flushed while waiting for the lock
+                await self.store.update_task_status(task_id, status, result=result, error_message=error_message, **fields)
+                return
+
+            task["status"] = plain(status)
+            if result is not None:
+                task["result"] = result
+            if error_message is not None:
+                task["error_message"] = error_message
+            task.update(fields)
+
+            if task["status"] in TERMINAL_STATUSES:
+                await self._flush(task_id, task)
+
+    async def list_tasks(self, query: TaskQuery) -> list[dict]:
+        stored = await self.store.list_tasks(query)
+        # a task being flushed may briefly be in both, the in-memory copy wins
+        hot = {
+            task_id: {k: v for k, v in task.items() if k != "result"}
+            for task_id, task in self._active.items()
+            if query.matches(task)
+        }
+        tasks = list(hot.values()) + [t for t in stored if t["task_id"] not in hot]
+        tasks.sort(key=lambda t: (t.get("created_at", 0), t["task_id"]), reverse=not query.oldest_first)
+        return tasks[:query.limit]
+
+    async def delete_tasks(self, task_ids: list[str]) -> None:
+        for task_id in task_ids:
+            self._active.pop(task_id, None)
+            self._locks.pop(task_id, None)
+        await self.store.delete_tasks(task_ids)
+
+    async def count_tasks(self) -> int:
+        return await self.store.count_tasks() + len(self._active)
+
+    async def storage_bytes(self) -> int:
+        return await self.store.storage_bytes()
+
+    async def compact(self) -> None:
+        await self.store.compact()
+
+    async def close(self) -> None:
+        if self._active:
+            logger.info(f"Flushing {len(self._active)} active task(s) to the task store")
+        for task_id, task in list(self._active.items()):
+            async with self._lock(task_id):
+                await self._flush(task_id, task)
+        await self.store.close()
+
+    def stats(self) -> dict:
+        return {"active": len(self._active)}
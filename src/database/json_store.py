@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import time
+import aiofiles
+from pathlib import Path
+
+from src.database.base import TaskStore, TaskQuery
+from src.database.serializers import payload_codec
+
+logger = logging.getLogger(__name__)
+
+MODES = ["http", "headless", "ui", "batch"]
+
+
+# Legacy backend: one file per task under storage/<mode>/, encoded with payload_codec.
+# Files written before the codec existed are plain JSON and still decode.
+class JsonFileTaskStore(TaskStore):
+
+    def __init__(self, data_dir: str):
+        self.data_dir = Path(data_dir)
+        for mode in MODES:
+            (self.data_dir / mode).mkdir(parents=True, exist_ok=True)
+        self._lock = asyncio.Lock() # serializes read-modify-write updates
+
+    def _get_file_path(self, task_id: str) -> Path:
+        try:
+            mode, _ = task_id.split("_", 1)
+        except ValueError:
+            return self.data_dir / f"{task_id}.json"
+
+        if mode in MODES:
+            return self.data_dir / mode / f"{task_id}.json"
+
+        return self.data_dir / f"{task_id}.json"
+
+    async def save_task(self, task_id: str, task_data: dict) -> None:
+        task_data = {"created_at": time.time(), **task_data} # never mutate the caller's dict
+        file_path = self._get_file_path(task_id)
+        async with aiofiles.open(file_path, mode='wb') as f:
+            await f.write(payload_codec.encode(task_data))
+
+    async def get_task(self, task_id: str) -> dict | None:
+        file_path = self._get_file_path(task_id)
+        if not file_path.exists():
+            return None
+
+        async with aiofiles.open(file_path, mode='rb') as f:
+            return payload_codec.decode(await f.read())
+
+    async def update_task_status(self, task_id: str, status: str, result=None, error_message=None, **fields) -> None:
+        async with self._lock:
+            current_data = await self.get_task(task_id)
+            if not current_data:
+                logger.error(f"Task {task_id} not found in DB during update attempt")
+                return
+
+            current_data['status'] = status
+            if result is not None:
+                current_data['result'] = result
+            if error_message is not None:
+                current_data['error_message'] = error_message
+            current_data.update(fields)
+
+            await self.save_task(task_id, current_data)
+
+    async def list_tasks(self, query: TaskQuery) -> list[dict]:
+        # full directory scan, use the sqlite backend if you need this to be fast
+        modes = [m for m in MODES if not query.modes or m in query.modes]
+        tasks = []
+        for m in modes:
+            for file_path in (self.data_dir / m).glob("*.json"):
+                task = await self.get_task(file_path.stem)
+                if task and query.matches(task):
+                    tasks.append(task)
+
+        tasks.sort(key=lambda t: (t.get("created_at", 0), t["task_id"]), reverse=not query.oldest_first)
+        return tasks[:query.limit]
+
+    async def delete_tasks(self, task_ids: list[str]) -> None:
+        for task_id in task_ids:
+            self._get_file_path(task_id).unlink(missing_ok=True)
+
+    async def count_tasks(self) -> int:
+        return sum(1 for m in MODES for _ in (self.data_dir / m).glob("*.json"))
+
+    async def storage_bytes(self) -> int:
+        return sum(f.stat().st_size for m in MODES for f in (self.data_dir / m).glob("*.json"))
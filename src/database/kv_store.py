@@ -0,0 +1,55 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+# Small sqlite-backed key/value table with per-entry expiry (used by the caches)
+class SqliteKeyValueStore:
+
+    def __init__(self, db_path: str, table: str = "cache"):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> tuple[float, Any] | None:
+        with self._lock:
+            row = self._conn.execute(f"SELECT expires_at, value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        if row[0] < time.time():
+            self._delete(key)
+            return None
+        return row[0], json.loads(row[1])
+
+    def _set(self, key: str, expires_at: float, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, expires_at, json.dumps(value, ensure_ascii=False)),
+            )
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    async def get(self, key: str) -> tuple[float, Any] | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, expires_at: float, value: Any) -> None:
+        await asyncio.to_thread(self._set, key, expires_at, value)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._delete, key)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,61 +1,67 @@
 import logging
-import json
-import aiofiles
-from pathlib import Path
 
-
-DATA_DIR = Path("storage")
-(DATA_DIR / "http").mkdir(parents=True, exist_ok=True)
-(DATA_DIR / "headless").mkdir(parents=True, exist_ok=True)
-(DATA_DIR / "ui").mkdir(parents=True, exist_ok=True)
+from src.config.storage import storage_config
+from src.database.base import TaskStore, TaskQuery, json_serializer, plain # noqa: F401 (re-exported)
+from src.database.task_events import task_events
+from src.database.retention import RetentionSweeper
+from src.utils.metrics import track_stage, mode_from_task_id
 
 logger = logging.getLogger(__name__)
 
-async def _get_file_path(task_id: str) -> Path:
-    
-    try:
-        mode, _ = task_id.split("_", 1)
-    except ValueError:
-        return DATA_DIR / f"{task_id}.json"
+
+def _create_backing_store() -> TaskStore:
+    if storage_config.backend == "sqlite":
+        from src.database.sqlite_store import SqliteTaskStore
+        return SqliteTaskStore(storage_config.sqlite_path)
+    if storage_config.backend == "json":
+        from src.database.json_store import JsonFileTaskStore
+        return JsonFileTaskStore(storage_config.data_dir)
+    raise ValueError(f"Unknown storage backend: {storage_config.backend}")
+
+
+def _wrap_hot_state(store: TaskStore) -> TaskStore:
+    if storage_config.hot_state_enabled:
+        from src.database.hot_state import HotStateTaskStore
+        return HotStateTaskStore(store)
+    return store
 
 
-    if mode in ["http", "headless", "ui"]:
-        return DATA_DIR / mode / f"{task_id}.json"
-    
-    return DATA_DIR / f"{task_id}.json"
+backing_store = _create_backing_store()
+task_store = _wrap_hot_state(backing_store)
+retention_sweeper = RetentionSweeper(task_store)
 
 
-def json_serializer(obj):
-    if hasattr(obj, 'model_dump'):
-        return obj.model_dump()
-    if hasattr(obj, 'dict'):
-        return obj.dict()
-    return str(obj)
+# Tasks written by the json backend (the default before sqlite) stay readable after upgrading
+async def import_legacy_tasks() -> None:
+    if storage_config.backend == "sqlite":
+        await backing_store.import_json_tasks(storage_config.data_dir) # type: ignore
+
 
 async def save_task(task_id: str, task_data: dict):
-    file_path = await _get_file_path(task_id)
-    async with aiofiles.open(file_path, mode='w', encoding='utf-8') as f:
-        await f.write(json.dumps(task_data, default=json_serializer, indent=4, ensure_ascii=False))
+    with track_stage(mode_from_task_id(task_id), "storage_write"):
+        await task_store.save_task(task_id, task_data)
+    task_events.publish(task_id, {
+        "task_id": task_id,
+        "status": plain(task_data.get("status")),
+        "result": task_data.get("result"),
+        "error_message": task_data.get("error_message"),
+    })
 
 async def get_task(task_id: str):
-    file_path = await _get_file_path(task_id)
-    if not file_path.exists():
-        return None
-    
-    async with aiofiles.open(file_path, mode='r', encoding='utf-8') as f:
-        content = await f.read()
-        return json.loads(content)
-
-async def update_task_status(task_id: str, status: str, result=None, error_message=None):
-    current_data = await get_task(task_id)
-    if not current_data:
-        logger.error(f"Task {task_id} not found in DB during update attempt")
-        return
-    
-    current_data['status'] = status
-    if result is not None:
-        current_data['result'] = result
-    if error_message is not None:
-        current_data['error_message'] = error_message
-
-    await save_task(task_id, current_data)
+    return await task_store.get_task(task_id)
+
+async def get_tasks(task_ids: list[str]) -> dict[str, dict]:
+    return await task_store.get_tasks(task_ids)
+
+async def update_task_status(task_id: str, status: str, result=None, error_message=None, **fields):
+    with track_stage(mode_from_task_id(task_id), "storage_write"):
+        await task_store.update_task_status(task_id, status, result=result, error_message=error_message, **fields)
+    task_events.publish(task_id, {
+        "task_id": task_id,
+        "status": plain(status),
+        "result": result,
+        "error_message": error_message,
+    })
+
+async def list_tasks(query: TaskQuery):
+    return await task_store.list_tasks(query)
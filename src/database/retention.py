@@ -0,0 +1,146 @@
+import asyncio
+import gzip
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.config.storage import storage_config
+from src.database.base import TaskStore, TaskQuery, json_serializer
+
+logger = logging.getLogger(__name__)
+
+SWEEP_CHUNK = 500
+
+
+# Background job that keeps the task store bounded:
+# 1. completed tasks older than their mode's TTL (or `archive_after`, if shorter) are appended to
+#    storage/archive/<mode>/<day>.jsonl.gz and removed from the live store,
+# 2. remaining tasks older than their mode's TTL are deleted,
+# 3. the oldest tasks are deleted while the store is above `max_tasks` / `max_bytes`,
+# 4. archive files older than `archive_ttl` are removed.
+class RetentionSweeper:
+
+    def __init__(self, store: TaskStore):
+        self.store = store
+        self.ttls = {
+            "http": storage_config.ttl_http,
+            "headless": storage_config.ttl_headless,
+            "ui": storage_config.ttl_ui,
+            "batch": storage_config.ttl_batch,
+        }
+        self.archive_dir = Path(storage_config.archive_dir)
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if storage_config.retention_enabled and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info("Retention sweeper started")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def sweep(self) -> dict:
+        now = time.time()
+        stats = {"archived": 0, "expired": 0, "evicted": 0, "archive_files_removed": 0}
+
+        for mode, ttl in self.ttls.items():
+            if storage_config.archive_enabled:
+                archive_age = ttl if storage_config.archive_after is None else min(ttl, storage_config.archive_after)
+                stats["archived"] += await self._archive_completed(mode, now - archive_age)
+            stats["expired"] += await self._delete_matching(TaskQuery(modes=[mode], created_before=now - ttl))
+
+        stats["evicted"] = await self._enforce_caps()
+        stats["archive_files_removed"] = await asyncio.to_thread(self._remove_old_archives, now)
+
+        if stats["archived"] or stats["expired"] or stats["evicted"]:
+            await self.store.compact()
+        return stats
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                stats = await self.sweep()
+                logger.info(f"Retention sweep finished: {stats}")
+            except Exception:
+                logger.exception("Retention sweep failed")
+            await asyncio.sleep(storage_config.sweep_interval)
+
+    async def _delete_matching(self, query: TaskQuery) -> int:
+        deleted = 0
+        query.limit = SWEEP_CHUNK
+        while True:
+            tasks = await self.store.list_tasks(query)
+            if not tasks:
+                return deleted
+            await self.store.delete_tasks([t["task_id"] for t in tasks])
+            deleted += len(tasks)
+
+    async def _archive_completed(self, mode: str, before: float) -> int:
+        query = TaskQuery(
+            modes=[mode], statuses=["completed"], created_before=before, limit=SWEEP_CHUNK, oldest_first=True,
+        )
+        archived = 0
+        while True:
+            summaries = await self.store.list_tasks(query)
+            if not summaries:
+                return archived
+
+            # the listing leaves results out, read full records
+            tasks = [t for t in [await self.store.get_task(s["task_id"]) for s in summaries] if t]
+            await asyncio.to_thread(self._append_to_archive, tasks)
+            await self.store.delete_tasks([s["task_id"] for s in summaries])
+            archived += len(summaries)
+
+    def _append_to_archive(self, tasks: list[dict]) -> None:
+        by_file: dict[Path, list[str]] = {}
+        for task in tasks:
+            day = datetime.fromtimestamp(task.get("created_at", 0), tz=timezone.utc).strftime("%Y-%m-%d")
+            path = self.archive_dir / str(task.get("mode")) / f"{day}.jsonl.gz"
+            by_file.setdefault(path, []).append(json.dumps(task, default=json_serializer, ensure_ascii=False))
+
+        for path, lines in by_file.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # appending adds a new gzip member, gzip.open reads all members back in order
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    async def _enforce_caps(self) -> int:
+        evicted = 0
+        oldest = TaskQuery(limit=SWEEP_CHUNK, oldest_first=True)
+
+        if storage_config.max_tasks is not None:
+            excess = await self.store.count_tasks() - storage_config.max_tasks
+            while excess > 0:
+                oldest.limit = min(excess, SWEEP_CHUNK)
+                tasks = await self.store.list_tasks(oldest)
+                if not tasks:
+                    break
+                await self.store.delete_tasks([t["task_id"] for t in tasks])
+                evicted += len(tasks)
+                excess -= len(tasks)
+
+        if storage_config.max_bytes is not None:
+            oldest.limit = SWEEP_CHUNK
+            while await self.store.storage_bytes() > storage_config.max_bytes:
+                tasks = await self.store.list_tasks(oldest)
+                if not tasks:
+                    break
+                await self.store.delete_tasks([t["task_id"] for t in tasks])
+                evicted += len(tasks)
+
+        return evicted
+
+    def _remove_old_archives(self, now: float) -> int:
+        if not self.archive_dir.exists():
+            return 0
+        removed = 0
+        for path in self.archive_dir.glob("*/*.jsonl.gz"):
+            if path.stat().st_mtime < now - storage_config.archive_ttl:
+                path.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,156 @@
+import gzip
+import json
+import logging
+from typing import Any
+
+from src.config.storage import storage_config
+from src.database.base import json_serializer
+
+logger = logging.getLogger(__name__)
+
+# Encoded payloads start with MAGIC + serializer code + compression code.
+# Anything without the header is read as legacy (possibly indented) JSON.
+MAGIC = b"\x00KS"
+
+
+class JsonSerializer:
+    name, code = "json", b"j"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=json_serializer, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    name, code = "orjson", b"o"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=json_serializer)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackSerializer:
+    name, code = "msgpack", b"m"
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, default=json_serializer)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data)
+
+
+class NoCompression:
+    name, code = "none", b"n"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class GzipCompression:
+    name, code = "gzip", b"g"
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=6)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+
+class ZstdCompression:
+    name, code = "zstd", b"z"
+
+    def __init__(self):
+        import zstandard
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+SERIALIZERS = {cls.name: cls for cls in (JsonSerializer, OrjsonSerializer, MsgpackSerializer)}
+COMPRESSIONS = {cls.name: cls for cls in (NoCompression, GzipCompression, ZstdCompression)}
+
+
+def _load(registry: dict, name: str, fallback, kind: str):
+    cls = registry.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown {kind}: {name}")
+    try:
+        return cls()
+    except ImportError:
+        logger.warning(f"{kind.capitalize()} '{name}' is not installed, falling back to '{fallback.name}'")
+        return fallback()
+
+
+class PayloadCodec:
+
+    def __init__(
+        self,
+        serializer: str = storage_config.serializer,
+        compression: str = storage_config.compression,
+        compress_min_bytes: int = storage_config.compress_min_bytes,
+    ):
+        self.serializer = _load(SERIALIZERS, serializer, JsonSerializer, "serializer")
+        self.compression = _load(COMPRESSIONS, compression, NoCompression, "compression")
+        self.compress_min_bytes = compress_min_bytes
+        # every known format, so payloads written with other settings stay readable
+        self._readers = {cls.code: cls for cls in SERIALIZERS.values()}
+        self._decompressors = {cls.code: cls for cls in COMPRESSIONS.values()}
+        self._instances: dict[bytes, Any] = {
+            self.serializer.code: self.serializer,
+            self.compression.code: self.compression,
+        }
+
+    def encode(self, obj: Any) -> bytes:
+        data = self.serializer.dumps(obj)
+        compression = self.compression
+        if len(data) < self.compress_min_bytes:
+            compression = NoCompression()
+        else:
+            data = compression.compress(data)
+
+        if self.serializer.code == JsonSerializer.code and compression.code == NoCompression.code:
+            return data # plain JSON needs no header
+        return MAGIC + self.serializer.code + compression.code + data
+
+    def decode(self, data: bytes | str) -> Any:
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data.startswith(MAGIC):
+            return json.loads(data)
+
+        serializer_code = data[len(MAGIC):len(MAGIC) + 1]
+        compression_code = data[len(MAGIC) + 1:len(MAGIC) + 2]
+        body = data[len(MAGIC) + 2:]
+
+        decompressor = self._instance(compression_code, self._decompressors)
+        return self._instance(serializer_code, self._readers).loads(decompressor.decompress(body))
+
+    def _instance(self, code: bytes, registry: dict):
+        if code not in self._instances:
+            if code not in registry:
+                raise ValueError(f"Unknown payload format code: {code!r}")
+            self._instances[code] = registry[code]()
+        return self._instances[code]
+
+
+payload_codec = PayloadCodec()
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src.database.base import TaskStore, TaskQuery, json_serializer, plain
+from src.database.serializers import payload_codec
+
+logger = logging.getLogger(__name__)
+
+GET_TASKS_CHUNK = 500
+
+COLUMNS = ("task_id", "mode", "status", "query", "created_at", "updated_at", "result", "error_message", "extra")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id       TEXT PRIMARY KEY,
+    mode          TEXT,
+    status        TEXT NOT NULL,
+    query         TEXT,
+    created_at    REAL NOT NULL,
+    updated_at    REAL NOT NULL,
+    result        BLOB, -- payload_codec output, legacy rows hold JSON text
+    error_message TEXT,
+    extra         TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_created ON tasks (status, created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_mode_created ON tasks (mode, created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at, task_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+# SQLite (WAL) backend: a single indexed table instead of a file per task.
+# sqlite3 is blocking, so every call runs in a worker thread behind one connection lock.
+class SqliteTaskStore(TaskStore):
+
+    def __init__(self, db_path: str):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL") # only applies to a new database file
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    async def _run(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        def execute():
+            with self._lock:
+                return self._conn.execute(sql, params).fetchall()
+        return await asyncio.to_thread(execute)
+
+    @staticmethod
+    def _dumps(value) -> str | None:
+        if value is None:
+            return None
+        return json.dumps(value, default=json_serializer, ensure_ascii=False)
+
+    @staticmethod
+    def _encode_result(value) -> bytes | None:
+        if value is None:
+            return None
+        return payload_codec.encode(value)
+
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> dict:
+        task = json.loads(row["extra"]) if row["extra"] else {}
+        task.update({
+            "task_id": row["task_id"],
+            "status": row["status"],
+            "mode": row["mode"],
+            "query": row["query"],
+            "created_at": row["created_at"],
+        })
+        if row["result"] is not None:
+            task["result"] = payload_codec.decode(row["result"])
+        if row["error_message"] is not None:
+            task["error_message"] = row["error_message"]
+        return task
+
+    def _row_values(self, task_id: str, task_data: dict) -> tuple:
+        now = time.time()
+        known = {"task_id", "mode", "status", "query", "created_at", "result", "error_message"}
+        extra = {k: v for k, v in task_data.items() if k not in known}
+        return (
+            task_id,
+            plain(task_data.get("mode")),
+            plain(task_data.get("status")),
+            task_data.get("query"),
+            task_data.get("created_at", now),
+            now,
+            self._encode_result(task_data.get("result")),
+            task_data.get("error_message"),
+            self._dumps(extra) if extra else None,
+        )
+
+    async def save_task(self, task_id: str, task_data: dict) -> None:
+        await self._run(
+            f"INSERT OR REPLACE INTO tasks ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            self._row_values(task_id, task_data),
+        )
+
+    # One-off import of the file-per-task layout (storage/<mode>/*.json) used before sqlite
+    # became the default. The files are left in place; a marker row makes it run only once.
+    async def import_json_tasks(self, data_dir: str) -> int:
+        from src.database.json_store import MODES
+
+        if await self._run("SELECT 1 FROM meta WHERE key = 'json_tasks_imported'"):
+            return 0
+
+        imported = 0
+        for mode in MODES:
+            for file_path in sorted((Path(data_dir) / mode).glob("*.json")):
+                try:
+                    task = payload_codec.decode(await asyncio.to_thread(file_path.read_bytes))
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable task file {file_path}: {str(e)}")
+                    continue
+                # never overwrite a task that already exists in sqlite
+                await self._run(
+                    f"INSERT OR IGNORE INTO tasks ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    self._row_values(task.get("task_id", file_path.stem), task),
+                )
+                imported += 1
+
+        await self._run("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_tasks_imported', ?)", (str(time.time()),))
+        if imported:
+            logger.info(f"Imported {imported} task(s) from {data_dir} into sqlite")
+        return imported
+
+    async def get_task(self, task_id: str) -> dict | None:
+        rows = await self._run("SELECT * FROM tasks WHERE task_id = ?", (task_id,))
+        return self._row_to_task(rows[0]) if rows else None
+
+    async def get_tasks(self, task_ids: list[str]) -> dict[str, dict]:
+        tasks = {}
+        # chunked to stay under sqlite's bound-parameter limit
+        for i in range(0, len(task_ids), GET_TASKS_CHUNK):
+            chunk = task_ids[i:i + GET_TASKS_CHUNK]
+            rows = await self._run(
+                f"SELECT * FROM tasks WHERE task_id IN ({', '.join('?' * len(chunk))})", tuple(chunk)
+            )
+            tasks.update((row["task_id"], self._row_to_task(row)) for row in rows)
+        return tasks
+
+    async def update_task_status(self, task_id: str, status: str, result=None, error_message=None, **fields) -> None:
+        # single UPDATE, no read-modify-write round trip
+        rows = await self._run(
+            "UPDATE tasks SET status = ?, updated_at = ?, "
+            "result = COALESCE(?, result), error_message = COALESCE(?, error_message), "
+            "extra = CASE WHEN ? IS NULL THEN extra ELSE json_patch(COALESCE(extra, '{}'), ?) END "
+            "WHERE task_id = ? RETURNING task_id",
+            (
+                plain(status), time.time(), self._encode_result(result), error_message,
+                self._dumps(fields or None), self._dumps(fields or None), task_id,
+            ),
+        )
+        if not rows:
+            logger.error(f"Task {task_id} not found in DB during update attempt")
+
+    async def list_tasks(self, query: TaskQuery) -> list[dict]:
+        clauses, params = [], []
+        if query.modes:
+            clauses.append(f"mode IN ({', '.join('?' * len(query.modes))})")
+            params.extend(query.modes)
+        if query.statuses:
+            clauses.append(f"status IN ({', '.join('?' * len(query.statuses))})")
+            params.extend(query.statuses)
+        if query.query_prefix:
+            # case-sensitive, unlike LIKE
+            clauses.append("substr(query, 1, ?) = ?")
+            params.extend((len(query.query_prefix), query.query_prefix))
+        if query.created_after is not None:
+            clauses.append("created_at >= ?")
+            params.append(query.created_after)
+        if query.created_before is not None:
+            clauses.append("created_at < ?")
+            params.append(query.created_before)
+        if query.cursor is not None:
+            clauses.append(f"(created_at, task_id) {'>' if query.oldest_first else '<'} (?, ?)")
+            params.extend(query.cursor)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "ASC" if query.oldest_first else "DESC"
+        # results can be large, the listing does not need them
+        rows = await self._run(
+            f"SELECT task_id, mode, status, query, created_at, NULL AS result, error_message, extra "
+            f"FROM tasks {where} ORDER BY created_at {order}, task_id {order} LIMIT ?",
+            (*params, query.limit),
+        )
+        return [self._row_to_task(row) for row in rows]
+
+    async def delete_tasks(self, task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+        await self._run(
+            f"DELETE FROM tasks WHERE task_id IN ({', '.join('?' * len(task_ids))})", tuple(task_ids)
+        )
+
+    async def count_tasks(self) -> int:
+        rows = await self._run("SELECT COUNT(*) FROM tasks")
+        return rows[0][0]
+
+    async def storage_bytes(self) -> int:
+        # pages actually in use, free pages left by deletions do not count
+        rows = await self._run(
+            "SELECT (SELECT page_count FROM pragma_page_count()) - (SELECT freelist_count FROM pragma_freelist_count()), "
+            "(SELECT page_size FROM pragma_page_size())"
+        )
+        return rows[0][0] * rows[0][1]
+
+    async def compact(self) -> None:
+        await self._run("PRAGMA incremental_vacuum")
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
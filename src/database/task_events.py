@@ -0,0 +1,36 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+# In-process pub/sub for task status changes, fed by mem_db on every write.
+# Each subscriber gets its own queue and may watch any number of task ids.
+class TaskEventBus:
+
+    def __init__(self):
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    def subscribe(self, task_ids: list[str]) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        for task_id in task_ids:
+            self._subscribers.setdefault(task_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, task_ids: list[str], queue: asyncio.Queue) -> None:
+        for task_id in task_ids:
+            queues = self._subscribers.get(task_id)
+            if queues is None:
+                continue
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[task_id]
+
+    def publish(self, task_id: str, event: dict) -> None:
+        for queue in self._subscribers.get(task_id, ()):
+            queue.put_nowait(event)
+
+
+task_events = TaskEventBus()
@@ -1,10 +1,23 @@
 import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from src.api import main_router 
 from fastapi.exceptions import RequestValidationError
 from src.api.exception_nadler import validation_exception_handler
+from src.scraping.browser_pool import browser_pool
+from src.scraping.http_client import http_client
+from src.database.mem_db import task_store, retention_sweeper, import_legacy_tasks
+from src.scraping.services.task_queue import task_queue
+from src.scraping.services.cache import result_cache
+from src.scraping.url_cache import movie_url_cache
+from src.scraping.details_cache import movie_details_cache
+from src.scraping.parsers.parse_pool import parse_pool
+from src.scraping.services.scraping_service import scraping_service
+from src.scraping.services.watchlist_refresher import watchlist_refresher
+from src.scraping.schemas import ScrapingMode
+from src.config.scraping import scraping_config
 
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
@@ -22,12 +35,37 @@ logging.basicConfig(
 
 logger = logging.getLogger("__name__")
 
-app = FastAPI()
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.include_router(main_router,prefix="/api")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup_modes = [ScrapingMode(m) for m in scraping_config.warmup_modes]
+    await import_legacy_tasks()
+    await http_client.start()
+    if warmup_modes:
+        parse_pool.start()
+    scraping_service.warm_up(warmup_modes)
+    if ScrapingMode.headless in warmup_modes or ScrapingMode.ui in warmup_modes:
+        await browser_pool.start() # otherwise launched on the first headless/ui task
+    await task_queue.start()
+    await retention_sweeper.start()
+    await watchlist_refresher.start()
+    logger.info(f"Application started, warmed up: {[m.value for m in warmup_modes]}")
+
+    yield
 
+    await task_queue.stop()
+    await retention_sweeper.stop()
+    await watchlist_refresher.stop()
+    await browser_pool.close()
+    await http_client.close()
+    parse_pool.close()
+    await task_store.close()
+    result_cache.close()
+    movie_url_cache.close()
+    movie_details_cache.close()
+    logger.info("Application stopped")
 
-@app.on_event("startup")
-async def on_startup():
-    logger.info("Application started")
\ No newline at end of file
+
+app = FastAPI(lifespan=lifespan)
+app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.include_router(main_router,prefix="/api")
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
+
+from src.config.scraping import scraping_config
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+    def __init__(self, browser: "Browser"):
+        self.browser = browser
+        self.pages_served = 0
+        self.active = 0
+        self.retiring = False # being closed and relaunched, takes no new leases
+
+    @property
+    def healthy(self) -> bool:
+        return self.browser.is_connected()
+
+
+# App-lifetime pool of Chromium instances. Every lease gets its own BrowserContext,
+# so cookies/storage never leak between scrapes while the browser process is reused.
+class BrowserPool:
+
+    def __init__(
+        self,
+        size: int = scraping_config.browser_pool_size,
+        contexts_per_browser: int = scraping_config.browser_contexts_per_browser,
+        max_pages_per_browser: int = scraping_config.browser_max_pages,
+        health_check_interval: float = scraping_config.browser_health_check_interval,
+    ):
+        self.size = size
+        self.contexts_per_browser = contexts_per_browser
+        self.max_pages_per_browser = max_pages_per_browser
+        self.health_check_interval = health_check_interval
+
+        self._playwright: "Playwright | None" = None
+        self._browsers: list[_PooledBrowser] = []
+        self._slots = asyncio.Semaphore(size * contexts_per_browser)
+        self._lock = asyncio.Lock()
+        self._swapped = asyncio.Condition(self._lock)
+        self._health_task: asyncio.Task | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self.started:
+                return
+            # imported here so deployments that never open a page never load playwright
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            for _ in range(self.size):
+                self._browsers.append(_PooledBrowser(await self._launch()))
+            self._health_task = asyncio.create_task(self._health_loop())
+            logger.info(f"Browser pool started with {self.size} browser(s)")
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._health_task:
+                self._health_task.cancel()
+                self._health_task = None
+            for pooled in self._browsers:
+                await self._close_browser(pooled.browser)
+            self._browsers.clear()
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+            logger.info("Browser pool closed")
+
+    @asynccontextmanager
+    async def page(self, **context_options) -> AsyncIterator["Page"]:
+        context_options.setdefault("user_agent", scraping_config.user_agent)
+
+        async with self._slots:
+            pooled = await self._acquire()
+            context = None
+            try:
+                context = await pooled.browser.new_context(**context_options)
+                yield await context.new_page()
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        # browser may have crashed mid-lease, health check will replace it
+                        pass
+                await self._release(pooled)
+
+    def stats(self) -> dict:
+        return {
+            "browsers": len(self._browsers),
+            "capacity": self.size * self.contexts_per_browser,
+            "in_use": sum(b.active for b in self._browsers),
+        }
+
+    async def _launch(self) -> "Browser":
+        return await self._playwright.chromium.launch( # type: ignore
+            headless=True,
+            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-gpu"]
+        )
+
+    async def _close_browser(self, browser: "Browser") -> None:
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing browser: {str(e)}")
+
+    def _worn_out(self, pooled: _PooledBrowser) -> bool:
+        return not pooled.healthy or pooled.pages_served >= self.max_pages_per_browser
+
+    # Called with pooled.retiring set. Closing and launching can take seconds, so the lock
+    # is only held to swap the new browser in and other leases keep going meanwhile.
+    async def _recycle(self, pooled: _PooledBrowser) -> None:
+        try:
+            await self._close_browser(pooled.browser)
+            browser = await self._launch()
+        except BaseException:
+            async with self._lock:
+                pooled.retiring = False
+                self._swapped.notify_all()
+            raise
+        async with self._lock:
+            pooled.browser = browser
+            pooled.pages_served = 0
+            pooled.retiring = False
+            self._swapped.notify_all()
+
+    async def _acquire(self) -> _PooledBrowser:
+        if not self.started:
+            await self.start()
+
+        while True:
+            async with self._lock:
+                await self._swapped.wait_for(
+                    lambda: not self.started or any(not b.retiring for b in self._browsers)
+                )
+                # prefer healthy browsers with page budget left, then the least busy one
+                pooled = min(
+                    (b for b in self._browsers if not b.retiring),
+                    key=lambda b: (not b.healthy, b.pages_served >= self.max_pages_per_browser, b.active),
+                )
+                if pooled.active > 0 or not self._worn_out(pooled):
+                    pooled.active += 1
+                    pooled.pages_served += 1
+                    return pooled
+                pooled.retiring = True
+            logger.info("Recycling pooled browser")
+            await self._recycle(pooled)
+
+    async def _release(self, pooled: _PooledBrowser) -> None:
+        async with self._lock:
+            pooled.active -= 1
+            if pooled.active > 0 or pooled.retiring or not self._worn_out(pooled):
+                return
+            pooled.retiring = True
+        logger.info("Recycling pooled browser after release")
+        try:
+            await self._recycle(pooled)
+        except Exception as e:
+            # runs in page()'s finally, the lease itself already succeeded
+            logger.error(f"Failed to relaunch browser: {str(e)}")
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            async with self._lock:
+                crashed = [b for b in self._browsers if b.active == 0 and not b.retiring and not b.healthy]
+                for pooled in crashed:
+                    pooled.retiring = True
+            for pooled in crashed:
+                logger.warning("Pooled browser crashed, relaunching")
+                try:
+                    await self._recycle(pooled)
+                except Exception as e:
+                    logger.error(f"Failed to relaunch browser: {str(e)}")
+
+browser_pool = BrowserPool()
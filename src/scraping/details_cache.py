@@ -0,0 +1,75 @@
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, asdict
+
+from src.config.scraping import scraping_config
+from src.database.kv_store import SqliteKeyValueStore
+from src.scraping.schemas import MovieDetails
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def details_fingerprint(details: MovieDetails) -> str:
+    data = json.dumps(details.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+# What we last saw for one film page: HTTP validators, a hash of the raw page,
+# a hash of the extracted fields and the extracted MovieDetails themselves
+@dataclass
+class DetailsEntry:
+    url: str
+    details: dict
+    fields_hash: str
+    content_hash: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    checked_at: float = 0.0
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# Film URL -> DetailsEntry, lets the details parser revalidate instead of re-extracting
+class MovieDetailsCache:
+
+    def __init__(self):
+        self._store = (
+            SqliteKeyValueStore(scraping_config.details_fingerprint_path, table="movie_details")
+            if scraping_config.details_revalidate and scraping_config.details_fingerprint_path
+            else None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._store is not None
+
+    async def get(self, url: str) -> DetailsEntry | None:
+        if self._store is None:
+            return None
+        entry = await self._store.get(url)
+        return DetailsEntry(**entry[1]) if entry else None
+
+    async def put(self, entry: DetailsEntry) -> None:
+        if self._store is None:
+            return
+        entry.checked_at = time.time()
+        await self._store.set(entry.url, entry.checked_at + scraping_config.details_fingerprint_ttl, asdict(entry))
+
+    def close(self) -> None:
+        if self._store:
+            self._store.close()
+
+
+movie_details_cache = MovieDetailsCache()
@@ -0,0 +1,77 @@
+import logging
+import httpx
+
+from src.config.scraping import scraping_config
+from src.utils.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+# Every request waits for its host's rate limiter slot, and every response feeds the limiter back
+class GovernedTransport(httpx.AsyncBaseTransport):
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        governor = rate_limiter.for_url(str(request.url))
+        async with governor.slot():
+            response = await self._transport.handle_async_request(request)
+        governor.report(response.status_code, response.headers.get("Retry-After"))
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# App-lifetime httpx client, so sequential requests to Kinorium reuse
+# TCP/TLS connections (and a single HTTP/2 connection when available).
+class KinoriumHttpClient:
+
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+        return self._client
+
+    async def start(self) -> None:
+        self.client
+        logger.info("Shared HTTP client started")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Shared HTTP client closed")
+
+    def _build_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=scraping_config.http_max_connections,
+            max_keepalive_connections=scraping_config.http_max_keepalive_connections,
+            keepalive_expiry=scraping_config.http_keepalive_expiry,
+        )
+        headers = {
+            "User-Agent": scraping_config.user_agent,
+            "Referer": scraping_config.base_url,
+        }
+
+        http2 = scraping_config.http2_enabled
+        if http2:
+            try:
+                import h2 # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+                http2 = False
+
+        transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=scraping_config.request_timeout,
+            transport=GovernedTransport(transport),
+        )
+
+
+http_client = KinoriumHttpClient()
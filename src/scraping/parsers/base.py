@@ -1,25 +1,48 @@
 import logging
-import urllib.parse
-from playwright.async_api import Page, Browser, Playwright
-from src.config.scraping import scraping_config
+from typing import TYPE_CHECKING
+from src.scraping.parsers.movie_details import build_search_url, absolute_url, MovieNotFoundError
+from src.scraping.url_cache import movie_url_cache
+from src.utils.rate_limiter import rate_limiter
+from src.utils.retry import UpstreamHTTPError
+from src.utils.metrics import track_stage
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
 # Base parser class for Kinorium scrapers (headless and UI)
 class KinoriumBaseParser:
+    mode = "headless" # metrics label
 
-    async def _launch_browser(self, p: Playwright) -> Browser:
-        return await p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-gpu"]
+    async def _block_heavy_resources(self, page: "Page") -> None:
+        await page.route("**/*", lambda route: route.abort() 
+            if route.request.resource_type in ["image", "media", "font", "stylesheet"] # optimize loading by blocking unnecessary resources
+            else route.continue_()
         )
 
-    async def _search_movie_url(self, page: Page, movie_title: str) -> str:
-        encoded_query = urllib.parse.quote(movie_title)
-        search_url = f"{scraping_config.base_url}/search/?q={encoded_query}"
+    # page.goto behind the same per-host rate limiter as the httpx client
+    async def _goto(self, page: "Page", url: str) -> None:
+        governor = rate_limiter.for_url(url)
+        async with governor.slot():
+            response = await page.goto(url, wait_until="domcontentloaded")
+        if response is not None:
+            governor.report(response.status, await response.header_value("retry-after"))
+            if response.status == 429 or response.status >= 500:
+                raise UpstreamHTTPError(f"Kinorium returned HTTP {response.status} for {url}", response.status)
+
+    # Cached title -> URL lookup, the search page is only loaded on a cache miss
+    async def _resolve_movie_url(self, page: "Page", movie_title: str) -> str:
+        with track_stage(self.mode, "search"):
+            return await movie_url_cache.resolve(
+                movie_title, lambda: self._search_movie_url(page, movie_title)
+            )
+
+    async def _search_movie_url(self, page: "Page", movie_title: str) -> str:
+        search_url = build_search_url(movie_title)
         
         logger.info(f"Searching for movie: {movie_title}")
-        await page.goto(search_url, wait_until="domcontentloaded")
+        await self._goto(page, search_url)
 
         results = page.locator("a.search-page__title-link")
         
@@ -30,15 +53,11 @@ class KinoriumBaseParser:
                 pass
         
         if await results.count() == 0:
-             raise ValueError("Movie not found in search results")
+             raise MovieNotFoundError("Movie not found in search results")
 
         movie_href = await results.first.get_attribute("href")
         
         if not movie_href:
             raise ValueError("Movie link attribute is empty")
 
-        return (
-            scraping_config.base_url + movie_href
-            if movie_href.startswith("/")
-            else movie_href
-        )
\ No newline at end of file
+        return absolute_url(movie_href)
\ No newline at end of file
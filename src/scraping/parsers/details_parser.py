@@ -0,0 +1,25 @@
+import logging
+
+from src.scraping.schemas import MovieDetails
+from src.config.scraping import scraping_config
+from src.scraping.parsers.http_details_parser import KinoriumHttpDetailsParser, IncompleteDetailsError
+from src.scraping.parsers.headless_parser import KinoriumHeadlessParser
+
+logger = logging.getLogger(__name__)
+
+
+# Parser behind the `headless` mode: static HTML first, Chromium only when that is not enough
+class KinoriumDetailsParser:
+
+    def __init__(self):
+        self.http_parser = KinoriumHttpDetailsParser()
+        self.headless_parser = KinoriumHeadlessParser()
+
+    async def parse(self, movie_title: str) -> MovieDetails:
+        if scraping_config.details_http_fast_path:
+            try:
+                return await self.http_parser.parse(movie_title)
+            except IncompleteDetailsError as e:
+                logger.info(f"HTTP fast path failed for '{movie_title}' ({str(e)}), falling back to headless")
+
+        return await self.headless_parser.parse(movie_title)
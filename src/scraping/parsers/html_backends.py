@@ -0,0 +1,141 @@
+import functools
+import logging
+from typing import Iterator
+
+from src.config.scraping import scraping_config
+
+logger = logging.getLogger(__name__)
+
+# (title, href) pairs straight from the markup, either may be missing
+RawItem = tuple[str | None, str | None]
+
+
+# Extracts film list items from the `result.html` payload of /handlers/filmList/.
+# All backends must yield exactly what the BeautifulSoup version yields.
+class FilmListBackend:
+    name = "base"
+
+    def iter_items(self, html: str) -> Iterator[RawItem]:
+        raise NotImplementedError
+
+
+class SoupBackend(FilmListBackend):
+    name = "bs4"
+
+    def iter_items(self, html: str) -> Iterator[RawItem]:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        for item in soup.find_all("div", class_="item"):
+            link_tag = item.find("a", class_="filmList__item-title")
+            if not link_tag:
+                continue
+
+            title_span = link_tag.find("span", class_="title")
+            title = title_span.get_text(strip=True) if title_span else None
+            yield title, link_tag.get("href") # type: ignore
+
+
+class LxmlBackend(FilmListBackend):
+    name = "lxml"
+
+    ITEM_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' item ')]"
+    LINK_XPATH = ".//a[contains(concat(' ', normalize-space(@class), ' '), ' filmList__item-title ')]"
+    TITLE_XPATH = ".//span[contains(concat(' ', normalize-space(@class), ' '), ' title ')]"
+
+    def __init__(self):
+        import lxml.html # noqa: F401 (fail early if not installed)
+
+    def iter_items(self, html: str) -> Iterator[RawItem]:
+        import lxml.html
+
+        if not html.strip():
+            return
+        root = lxml.html.document_fromstring(html)
+        for item in root.xpath(self.ITEM_XPATH):
+            links = item.xpath(self.LINK_XPATH)
+            if not links:
+                continue
+
+            link_tag = links[0]
+            spans = link_tag.xpath(self.TITLE_XPATH)
+            title = "".join(t.strip() for t in spans[0].itertext()) if spans else None
+            yield title, link_tag.get("href")
+
+
+class SelectolaxBackend(FilmListBackend):
+    name = "selectolax"
+
+    def __init__(self):
+        import selectolax.lexbor # noqa: F401 (fail early if not installed)
+
+    def iter_items(self, html: str) -> Iterator[RawItem]:
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+        for item in tree.css("div.item"):
+            link_tag = item.css_first("a.filmList__item-title")
+            if link_tag is None:
+                continue
+
+            title_span = link_tag.css_first("span.title")
+            title = title_span.text(deep=True, separator="", strip=True) if title_span else None
+            yield title, link_tag.attributes.get("href")
+
+
+BACKENDS: dict[str, type[FilmListBackend]] = {
+    SoupBackend.name: SoupBackend,
+    LxmlBackend.name: LxmlBackend,
+    SelectolaxBackend.name: SelectolaxBackend,
+}
+
+
+def get_backend(name: str = scraping_config.html_parser_backend) -> FilmListBackend:
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+    try:
+        return backend_cls()
+    except ImportError:
+        logger.warning(f"HTML parser backend '{name}' is not installed, falling back to BeautifulSoup")
+        return SoupBackend()
+
+
+# Tree builder for code that walks a full BeautifulSoup tree: lxml when installed, else the stdlib parser
+@functools.cache
+def soup_features() -> str:
+    try:
+        import lxml # noqa: F401
+    except ImportError:
+        logger.warning("lxml is not installed, BeautifulSoup falls back to html.parser")
+        return "html.parser"
+    return "lxml"
+
+
+# Plain dicts ready for MovieShort(**item)
+def extract_film_list(html: str, backend: FilmListBackend) -> list[dict]:
+    results = []
+    for title, href in backend.iter_items(html):
+        if not href:
+            continue
+        if not title:
+            logger.warning(f"Skipping item without title. Link: {href}") # Case when title is missing (without this will be pydantic.ValidationError)
+            continue
+
+        full_link = (
+            scraping_config.base_url + href
+            if href.startswith("/")
+            else href
+        )
+        results.append({"title": title, "link": full_link})
+    return results
+
+
+_backends: dict[str, FilmListBackend] = {} # per process, the parse pool workers build their own
+
+
+def parse_film_list(html: str, backend_name: str = scraping_config.html_parser_backend) -> list[dict]:
+    backend = _backends.get(backend_name)
+    if backend is None:
+        backend = _backends[backend_name] = get_backend(backend_name)
+    return extract_film_list(html, backend)
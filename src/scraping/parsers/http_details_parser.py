@@ -0,0 +1,107 @@
+import logging
+import httpx
+
+from src.scraping.schemas import MovieDetails
+from src.scraping.http_client import http_client
+from src.scraping.parsers.movie_details import (
+    build_search_url,
+    absolute_url,
+    build_movie_details,
+    extract_details_html,
+    extract_search_href,
+)
+from src.scraping.parsers.parse_pool import parse_pool
+from src.scraping.url_cache import movie_url_cache
+from src.scraping.details_cache import DetailsEntry, movie_details_cache, content_hash, details_fingerprint
+from src.utils.retry import UpstreamHTTPError
+from src.utils.metrics import track_stage, details_revalidations_total
+from src.config.scraping import scraping_config
+
+logger = logging.getLogger(__name__)
+
+# without these the HTTP result is not trusted and the browser path takes over
+REQUIRED_FIELDS = ("title", "year")
+
+
+class IncompleteDetailsError(Exception):
+    pass
+
+
+# Reads the server-rendered search and film pages over plain HTTP.
+# A film page seen before is revalidated first (ETag / Last-Modified, then a hash of the body)
+# and the stored MovieDetails are reused when it has not changed.
+class KinoriumHttpDetailsParser:
+    mode = "headless" # metrics label, this parser serves the headless mode
+
+    async def parse(self, movie_title: str) -> MovieDetails:
+        with track_stage(self.mode, "search"):
+            kinorium_url = await movie_url_cache.resolve(movie_title, lambda: self._search_movie_url(movie_title))
+        logger.info(f"Found movie URL over HTTP: {kinorium_url}")
+
+        entry = await movie_details_cache.get(kinorium_url)
+        with track_stage(self.mode, "navigation"):
+            response = await self._get(kinorium_url, entry.conditional_headers() if entry else None)
+
+        body_hash = None
+        if response.status_code != 304:
+            body_hash = content_hash(response.content)
+        if entry is not None:
+            if response.status_code == 304:
+                return await self._reuse(entry, "not_modified")
+            if body_hash == entry.content_hash:
+                return await self._reuse(entry, "same_content")
+
+        with track_stage(self.mode, "extraction"):
+            raw = await parse_pool.run(extract_details_html, response.text)
+        missing = [field for field in REQUIRED_FIELDS if not raw.get(field)]
+        if missing:
+            raise IncompleteDetailsError(f"Missing fields in static HTML: {', '.join(missing)}")
+
+        details = build_movie_details(raw, kinorium_url)
+        new_entry = DetailsEntry(
+            url=kinorium_url,
+            details=details.model_dump(mode="json"),
+            fields_hash=details_fingerprint(details),
+            content_hash=body_hash,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        if entry is None:
+            outcome = "new"
+        else:
+            # the page bytes changed (ads, tokens...) but the fields may still be the same
+            outcome = "same_fields" if entry.fields_hash == new_entry.fields_hash else "changed"
+        details_revalidations_total.inc(outcome)
+        await movie_details_cache.put(new_entry)
+        return details
+
+    async def _reuse(self, entry: DetailsEntry, outcome: str) -> MovieDetails:
+        logger.info(f"Film page unchanged ({outcome}), reusing stored details: {entry.url}")
+        details_revalidations_total.inc(outcome)
+        await movie_details_cache.put(entry) # extends the entry's TTL
+        return MovieDetails.model_validate(entry.details)
+
+    async def _search_movie_url(self, movie_title: str) -> str:
+        search_html = await self._fetch(build_search_url(movie_title))
+        href = await parse_pool.run(extract_search_href, search_html)
+        if not href:
+            # the results list may be rendered by JS, so this is not a definitive "not found"
+            raise IncompleteDetailsError("No search results in static HTML")
+        return absolute_url(href)
+
+    async def _fetch(self, url: str) -> str:
+        return (await self._get(url)).text
+
+    # 304 Not Modified is returned as is, any other non-2xx status raises
+    async def _get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        try:
+            response = await http_client.client.get(url, headers={"Accept": "text/html", **(headers or {})})
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Kinorium did not respond in {scraping_config.request_timeout} seconds")
+        except httpx.HTTPStatusError as e:
+            raise UpstreamHTTPError(f"Kinorium returned HTTP error: {str(e)}", e.response.status_code)
+        except httpx.RequestError as e:
+            raise ConnectionError(f"Error connecting to Kinorium: {str(e)}")
+        return response
@@ -1,8 +1,12 @@
 import logging
 import httpx
-from bs4 import BeautifulSoup
 
 from src.scraping.schemas import MovieShort
+from src.scraping.http_client import http_client
+from src.scraping.parsers.html_backends import get_backend, parse_film_list
+from src.scraping.parsers.parse_pool import parse_pool
+from src.utils.retry import UpstreamHTTPError
+from src.utils.metrics import track_stage
 from src.config.scraping import (
     scraping_config,
     GENRES_MAP,
@@ -12,6 +16,10 @@ from src.config.scraping import (
 
 logger = logging.getLogger(__name__)
 class KinoriumHttpParser:
+
+    def __init__(self):
+        self.html_backend = get_backend()
+
     async def parse(
         self,
         genre_name: str,
@@ -27,10 +35,8 @@ class KinoriumHttpParser:
         url = scraping_config.base_url + KINORIUM_ENDPOINTS["film_list"]
 
         headers = {
-            "User-Agent": scraping_config.user_agent,
             "Accept": "application/json, text/javascript, */*; q=0.01",
             "X-Requested-With": "XMLHttpRequest",
-            "Referer": scraping_config.base_url,
         }
 
         params = {
@@ -44,13 +50,11 @@ class KinoriumHttpParser:
         try:    
 
             logger.info(f"Starting scraping for genre '{genre_name}' (ID: {genre_id}) - Page {page}")
-            async with httpx.AsyncClient(
-                headers=headers,
-                timeout=scraping_config.request_timeout,
-            ) as client:
-                response = await client.get(url, params=params)
+            with track_stage("http", "navigation"):
+                response = await http_client.client.get(url, params=params, headers=headers)
 
-                logger.info(f"Received response status: {response.status_code}")
+            logger.info(f"Received response status: {response.status_code}")
+            response.raise_for_status()
              
             try:
                 data = response.json()
@@ -65,38 +69,15 @@ class KinoriumHttpParser:
             raise TimeoutError(f"Kinorium did not respond in {scraping_config.request_timeout} seconds") 
         except httpx.HTTPStatusError as e:
             # Errors from website like: 404, 500 , 503
-            raise RuntimeError(f"Kinorium returned HTTP error: {str(e)}")
+            raise UpstreamHTTPError(f"Kinorium returned HTTP error: {str(e)}", e.response.status_code)
         except httpx.RequestError as e:
             raise ConnectionError(f"Error connecting to Kinorium: {str(e)}")    
             
 
 
-        soup = BeautifulSoup(html, "html.parser")
-
-        results = []
-        for item in soup.find_all("div", class_="item"):
-            link_tag = item.find("a", class_="filmList__item-title")
-            if not link_tag:
-                continue
-
-            title_span = link_tag.find("span", class_="title")
-            title = title_span.get_text(strip=True) if title_span else None
-
-            if not title:
-                logger.warning(f"Skipping item without title. Link: {href}") # Case when title is missing (without this will be pydantic.ValidationError)
-                continue
-           
-            href = link_tag.get("href")
-            if not href:
-                continue
-
-            full_link = (
-                scraping_config.base_url + href # type: ignore
-                if href.startswith("/") # type: ignore
-                else href
-            )
-
-            results.append(MovieShort(title=title, link=full_link)) # type: ignore
+        with track_stage("http", "html_parse"):
+            items = await parse_pool.run(parse_film_list, html, self.html_backend.name)
+        results = [MovieShort(**item) for item in items]
 
         logger.info(f"Successfully scraped {len(results)} movies for genre '{genre_name}' on page {page}")
         return results
@@ -0,0 +1,116 @@
+import logging
+import re
+import urllib.parse
+from bs4 import BeautifulSoup
+
+from src.scraping.schemas import MovieDetails
+from src.config.scraping import scraping_config
+from src.scraping.parsers.html_backends import soup_features
+
+logger = logging.getLogger(__name__)
+
+DURATION_RE = re.compile(r"(\d+)\s*год\s*(\d+)\s*хв|(\d+)\s*хв")
+
+
+class MovieNotFoundError(ValueError):
+    pass
+
+
+def build_search_url(movie_title: str) -> str:
+    encoded_query = urllib.parse.quote(movie_title)
+    return f"{scraping_config.base_url}/search/?q={encoded_query}"
+
+
+def absolute_url(href: str) -> str:
+    return (
+        scraping_config.base_url + href
+        if href.startswith("/")
+        else href
+    )
+
+
+# Static HTML -> plain data. Module-level so they can run in the parse pool.
+def extract_search_href(html: str) -> str | None:
+    link = BeautifulSoup(html, soup_features()).select_one("a.search-page__title-link")
+    return link.get("href") if link else None # type: ignore
+
+
+# Produces the same raw fields as EXTRACT_DETAILS_JS in the headless parser
+def extract_details_html(html: str) -> dict:
+    soup = BeautifulSoup(html, soup_features())
+
+    def text(selector: str) -> str | None:
+        el = soup.select_one(selector)
+        return el.get_text() if el else None
+
+    def texts(selector: str) -> list[str]:
+        return [el.get_text().strip() for el in soup.select(selector)]
+
+    duration = None
+    for row in soup.select("tr"):
+        legend = row.select_one("td.legend")
+        if legend and "тривалість" in legend.get_text().lower():
+            data = row.select_one("td.data")
+            duration = data.get_text() if data else None
+            break
+
+    return {
+        "title": text("h1.film-page__title-text"),
+        "original_title": text("span[itemprop='alternativeHeadline']"),
+        "year": text("span.film-page__date a"),
+        "rating": text("div.film-page__title-rating"),
+        "description": text("section.film-page__text[itemprop='description']"),
+        "genres": texts("li[itemprop='genre'] a"),
+        "countries": texts("a[itemprop='countryOfOrigin']"),
+        "production_studios": texts("span.film-page__company a nobr"),
+        "actors": texts("div.film-page__cast-item[itemprop='actor'] span[itemprop='name']")[:10],
+        "duration": duration,
+    }
+
+
+# Raw film page fields (plain strings/lists, as read from the page) -> MovieDetails.
+# Shared by every details parser so they all normalize values the same way.
+def build_movie_details(raw: dict, kinorium_url: str) -> MovieDetails:
+    title = raw.get("title")
+    original_title = raw.get("original_title")
+    description = raw.get("description")
+
+    year = None
+    year_text = raw.get("year")
+    if year_text and year_text.isdigit():
+        year = int(year_text)
+
+    rating = None
+    rating_text = raw.get("rating")
+    if rating_text:
+        clean_rating = rating_text.strip().replace(".", "")
+        if clean_rating.isdigit():
+            rating = float(rating_text.strip())
+
+    return MovieDetails(
+        title=title.strip() if title else "Unknown",
+        original_title=original_title.strip() if original_title else None,
+        year=year,
+        rating=rating,
+        genres=raw.get("genres") or [],
+        countries=raw.get("countries") or [],
+        duration_minutes=parse_duration(raw.get("duration")),
+        description=description.strip() if description else None,
+        production_studios=raw.get("production_studios") or [],
+        actors=(raw.get("actors") or [])[:10],
+        kinorium_url=kinorium_url, # type: ignore
+    )
+
+
+def parse_duration(duration_text: str | None) -> int | None:
+    if not duration_text:
+        return None
+
+    match = DURATION_RE.search(duration_text)
+    if not match:
+        return None
+    if match.group(3): 
+        return int(match.group(3))
+    h = int(match.group(1) or 0)
+    m = int(match.group(2) or 0)
+    return h * 60 + m
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from src.config.scraping import scraping_config
+
+logger = logging.getLogger(__name__)
+
+
+# Runs CPU-bound HTML parsing off the event loop. Jobs must be module-level functions
+# that take raw HTML and return plain dicts, so they can cross a process boundary.
+class ParsePool:
+
+    def __init__(
+        self,
+        kind: str = scraping_config.parse_executor,
+        workers: int | None = scraping_config.parse_workers,
+        inline_max_bytes: int = scraping_config.parse_inline_max_bytes,
+    ):
+        if kind not in ("process", "thread", "inline"):
+            raise ValueError(f"Unknown parse executor: {kind}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.inline_max_bytes = inline_max_bytes
+        self._executor: Executor | None = None
+
+    def start(self) -> None:
+        if self._executor is not None or self.kind == "inline":
+            return
+        if self.kind == "process":
+            # spawn: forking a process that already runs an event loop and worker threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse")
+        logger.info(f"Parse pool started: {self.kind} x{self.workers}")
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Parse pool closed")
+
+    async def run(self, func: Callable[..., Any], html: str, *args) -> Any:
+        if self.kind == "inline" or len(html) <= self.inline_max_bytes:
+            return func(html, *args)
+
+        self.start()
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, func, html, *args)
+        except BrokenProcessPool:
+            # a worker process died (OOM, segfault in a parser), which breaks the whole pool
+            if self._executor is executor:
+                logger.warning("Parse pool is broken, restarting it")
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True) # type: ignore
+                self.start()
+            return await loop.run_in_executor(self._executor, func, html, *args)
+
+    def stats(self) -> dict:
+        return {"kind": self.kind, "workers": self.workers, "started": self._executor is not None}
+
+
+parse_pool = ParsePool()
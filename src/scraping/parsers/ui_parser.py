@@ -1,13 +1,14 @@
 import logging
 import webbrowser
-from playwright.async_api import async_playwright
 
 from src.scraping.schemas import UIActionResponse
+from src.scraping.browser_pool import browser_pool
 from src.scraping.parsers.base import KinoriumBaseParser  
 
 logger = logging.getLogger(__name__)
 
 class KinoriumUIParser(KinoriumBaseParser): 
+    mode = "ui"
     
     async def parse(self, movie_title: str) -> dict:
         logger.info(f"Starting UI mode for '{movie_title}'")
@@ -25,10 +26,6 @@ class KinoriumUIParser(KinoriumBaseParser):
         if not success:
             logger.warning(f"Failed to open the system web browser for URL {url}.")
     async def _find_movie_url_helper(self, movie_title: str) -> str:
-        async with async_playwright() as p:
-            browser = await self._launch_browser(p)
-            try:
-                page = await browser.new_page()
-                return await self._search_movie_url(page, movie_title)
-            finally:
-                await browser.close()
\ No newline at end of file
+        async with browser_pool.page() as page:
+            await self._block_heavy_resources(page)
+            return await self._resolve_movie_url(page, movie_title)
\ No newline at end of file
@@ -1,5 +1,6 @@
+from datetime import datetime
 from typing import Optional, Any, List
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 from enum import Enum
 
 
@@ -15,6 +16,12 @@ class TaskStatus(str, Enum):
     failed = "failed"
     completed = "completed"
 
+
+class TaskPriority(str, Enum):
+    high = "high"     # interactive, jumps ahead of queued bulk work
+    normal = "normal"
+    low = "low"       # bulk enrichment, default for batch items
+
 # schema for http
 class MovieShort(BaseModel):
     title: str
@@ -42,10 +49,66 @@ class UIActionResponse(BaseModel):
 class ScrapeRequest(BaseModel):
     query: str
     mode: ScrapingMode
+    priority: Optional[TaskPriority] = None # normal if not set (low for batch items)
 
     
 class ScrapeResponse(BaseModel):
     task_id: str
     status: TaskStatus
     result: Optional[Any] = None
-    error_message: Optional[str] = None
\ No newline at end of file
+    error_message: Optional[str] = None
+    cached: bool = False
+    attempts: Optional[int] = None
+    queue_wait_seconds: Optional[float] = None
+
+class TaskSummary(BaseModel):
+    task_id: str
+    mode: ScrapingMode
+    status: TaskStatus
+    query: str
+    created_at: datetime
+    error_message: Optional[str] = None
+
+
+class TaskListResponse(BaseModel):
+    items: List[TaskSummary]
+    next_cursor: Optional[str] = None # pass back as `cursor` to get the next page
+
+
+class CrawlRequest(BaseModel):
+    genre: Optional[str] = None # None = every genre from GENRES_MAP
+    max_pages: Optional[int] = Field(default=None, ge=1)
+    perpage: Optional[int] = Field(default=None, ge=1, le=200)
+
+
+class BatchScrapeRequest(BaseModel):
+    # either a list of full requests, or one mode with a list of queries
+    requests: Optional[List[ScrapeRequest]] = None
+    mode: Optional[ScrapingMode] = None
+    queries: Optional[List[str]] = None
+    priority: Optional[TaskPriority] = None # for items that do not set their own, low if not set
+
+    @model_validator(mode="after")
+    def check_items(self):
+        if self.requests is None and (self.mode is None or self.queries is None):
+            raise ValueError("Provide either 'requests' or 'mode' with 'queries'")
+        if self.requests is not None and self.queries is not None:
+            raise ValueError("'requests' and 'queries' can not be used together")
+        return self
+
+    def items(self) -> List[ScrapeRequest]:
+        priority = self.priority or TaskPriority.low
+        if self.requests is not None:
+            return [r if r.priority else r.model_copy(update={"priority": priority}) for r in self.requests]
+        return [ScrapeRequest(query=q, mode=self.mode, priority=priority) for q in self.queries] # type: ignore
+
+
+class BatchScrapeResponse(BaseModel):
+    batch_id: str
+    status: TaskStatus
+    total: int
+    pending: int = 0
+    in_progress: int = 0
+    completed: int = 0
+    failed: int = 0
+    items: List[ScrapeResponse] = []
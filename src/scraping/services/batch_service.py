@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import uuid
+
+from src.config.scraping import scraping_config
+from src.database.mem_db import save_task, get_task, update_task_status
+from src.scraping.schemas import BatchScrapeRequest, BatchScrapeResponse, ScrapeRequest, TaskStatus
+from src.scraping.services.scraping_service import ScrapingService, scraping_service, run_detached
+from src.scraping.services.task_queue import task_queue
+
+logger = logging.getLogger(__name__)
+
+BATCH_MODE = "batch"
+
+
+# Runs many queries as one unit: every item is a regular task record,
+# the batch record only keeps the list of task ids.
+class BatchService:
+
+    def __init__(self, scraping_service: ScrapingService):
+        self.scraping_service = scraping_service
+
+    async def start(self, batch: BatchScrapeRequest) -> BatchScrapeResponse:
+        items = batch.items()
+        if not items:
+            raise ValueError("Batch is empty")
+        if len(items) > scraping_config.batch_max_items:
+            raise ValueError(f"Batch is too large, max {scraping_config.batch_max_items} items")
+
+        batch_id = f"{BATCH_MODE}_{uuid.uuid4()}"
+        task_ids = []
+        pending = []
+        for request in items:
+            request = self.scraping_service.normalize(request)
+            task_id = self.scraping_service.new_task_id(request.mode)
+            cached_response = await self.scraping_service.create_task(task_id, request, batch_id=batch_id)
+            task_ids.append(task_id)
+            if not cached_response:
+                pending.append((task_id, request))
+
+        await save_task(batch_id, {
+            "task_id": batch_id,
+            "status": TaskStatus.in_progress if pending else TaskStatus.completed,
+            "mode": BATCH_MODE,
+            "query": f"{len(items)} items",
+            "task_ids": task_ids,
+        })
+        logger.info(f"Created batch {batch_id} with {len(items)} items ({len(pending)} to scrape)")
+
+        if pending:
+            run_detached(self._run(batch_id, pending))
+
+        return await self.get_status(batch_id) # type: ignore
+
+    async def get_status(self, batch_id: str, include_results: bool = False) -> BatchScrapeResponse | None:
+        batch = await get_task(batch_id)
+        if not batch or batch.get("mode") != BATCH_MODE:
+            return None
+
+        counts = {status: 0 for status in TaskStatus}
+        items = []
+        statuses = await self.scraping_service.get_statuses(batch.get("task_ids", []))
+        for task_id in batch.get("task_ids", []):
+            item = statuses.get(task_id)
+            if not item:
+                continue
+            counts[item.status] += 1
+            if not include_results:
+                item.result = None
+            items.append(item)
+
+        return BatchScrapeResponse(
+            batch_id=batch_id,
+            status=batch["status"],
+            total=len(batch.get("task_ids", [])),
+            pending=counts[TaskStatus.pending],
+            in_progress=counts[TaskStatus.in_progress],
+            completed=counts[TaskStatus.completed],
+            failed=counts[TaskStatus.failed],
+            items=items,
+        )
+
+    async def _run(self, batch_id: str, pending: list[tuple[str, ScrapeRequest]]) -> None:
+        semaphore = asyncio.Semaphore(scraping_config.batch_concurrency)
+
+        # items go through task_queue (at their own priority, low by default) so a big batch
+        # shares the per-mode workers fairly instead of running beside them
+        async def run_item(task_id: str, request: ScrapeRequest):
+            async with semaphore:
+                await task_queue.run(request.mode, self.scraping_service.job(task_id, request), request.priority) # type: ignore
+
+        await asyncio.gather(*(run_item(task_id, request) for task_id, request in pending))
+        await update_task_status(batch_id, TaskStatus.completed)
+        logger.info(f"Batch {batch_id} finished")
+
+
+batch_service = BatchService(scraping_service)
@@ -0,0 +1,104 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.config.scraping import scraping_config
+from src.database.base import json_serializer
+from src.database.kv_store import SqliteKeyValueStore
+from src.scraping.schemas import ScrapingMode
+from src.utils.metrics import cache_requests_total
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+# Scrape results keyed by (mode, normalized query): in-memory LRU with per-mode TTLs,
+# optionally backed by sqlite. Values are stored as plain JSON-compatible data.
+class ResultCache:
+
+    def __init__(self):
+        self.enabled = scraping_config.cache_enabled
+        self.max_entries = scraping_config.cache_max_entries
+        self.ttls = {
+            ScrapingMode.http: scraping_config.cache_ttl_http,
+            ScrapingMode.headless: scraping_config.cache_ttl_headless,
+            ScrapingMode.ui: scraping_config.cache_ttl_ui,
+        }
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._persistent = (
+            SqliteKeyValueStore(scraping_config.cache_persistent_path)
+            if scraping_config.cache_persistent_path
+            else None
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _is_cacheable(self, mode: ScrapingMode) -> bool:
+        return self.enabled and self.ttls.get(mode, 0) > 0
+
+    @staticmethod
+    def make_key(mode: ScrapingMode, query: str) -> str:
+        return f"{mode.value}:{normalize_query(query)}"
+
+    async def get(self, mode: ScrapingMode, query: str) -> Any | None:
+        if not self._is_cacheable(mode):
+            return None
+
+        key = self.make_key(mode, query)
+        entry = self._entries.get(key)
+        if entry and entry[0] < time.time():
+            del self._entries[key]
+            entry = None
+
+        if entry is None and self._persistent:
+            entry = await self._persistent.get(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            self.misses += 1
+            cache_requests_total.inc(mode, "miss")
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        cache_requests_total.inc(mode, "hit")
+        return entry[1]
+
+    async def set(self, mode: ScrapingMode, query: str, value: Any) -> None:
+        if not self._is_cacheable(mode) or value is None:
+            return
+
+        key = self.make_key(mode, query)
+        plain_value = json.loads(json.dumps(value, default=json_serializer))
+        entry = (time.time() + self.ttls[mode], plain_value)
+        self._remember(key, entry)
+        if self._persistent:
+            await self._persistent.set(key, *entry)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        if self._persistent:
+            self._persistent.close()
+
+    def _remember(self, key: str, entry: tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+result_cache = ResultCache()
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from src.config.scraping import scraping_config, GENRES_MAP
+from src.scraping.parsers.http_parser import KinoriumHttpParser
+from src.scraping.schemas import CrawlRequest, MovieShort
+
+logger = logging.getLogger(__name__)
+
+
+# Walks the film list page by page and yields movies as soon as each page arrives,
+# fetching up to `crawl_concurrency` pages ahead. Nothing is accumulated in memory.
+class CrawlService:
+
+    def __init__(self, parser: KinoriumHttpParser | None = None):
+        self.parser = parser or KinoriumHttpParser()
+
+    def resolve_genres(self, request: CrawlRequest) -> list[str]:
+        if request.genre is None:
+            return list(GENRES_MAP)
+        genre = request.genre.lower()
+        if genre not in GENRES_MAP:
+            raise ValueError(f"Unknown genre: {request.genre}")
+        return [genre]
+
+    async def crawl(self, request: CrawlRequest) -> AsyncIterator[MovieShort]:
+        perpage = request.perpage or scraping_config.crawl_perpage
+        max_pages = request.max_pages or scraping_config.crawl_max_pages
+
+        for genre in self.resolve_genres(request):
+            async for movie in self._crawl_genre(genre, perpage, max_pages):
+                yield movie
+
+    async def _crawl_genre(self, genre: str, perpage: int, max_pages: int) -> AsyncIterator[MovieShort]:
+        page = 1
+        while page <= max_pages:
+            window = range(page, min(page + scraping_config.crawl_concurrency, max_pages + 1))
+            batches = await asyncio.gather(
+                *(self.parser.parse(genre, page=p, perpage=perpage) for p in window)
+            )
+
+            for movies in batches:
+                for movie in movies:
+                    yield movie
+                if len(movies) < perpage:
+                    logger.info(f"Crawl of genre '{genre}' reached the last page")
+                    return
+
+            page += len(window)
+
+        logger.info(f"Crawl of genre '{genre}' stopped at the page cap ({max_pages})")
+
+
+crawl_service = CrawlService()
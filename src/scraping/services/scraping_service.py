@@ -1,27 +1,127 @@
 import logging
 import asyncio
+import base64
+import json
 import uuid
-from src.scraping.schemas import ScrapeRequest, ScrapeResponse, ScrapingMode, TaskStatus
-from src.database.mem_db import save_task, get_task
-from src.scraping.parsers.headless_parser import KinoriumHeadlessParser
-from src.scraping.parsers.http_parser import KinoriumHttpParser
-from src.scraping.parsers.ui_parser import KinoriumUIParser 
+from datetime import datetime
+from typing import Awaitable
+from src.scraping.schemas import (
+    ScrapeRequest, ScrapeResponse, ScrapingMode, TaskStatus, TaskPriority, TaskSummary, TaskListResponse,
+)
+from src.database.mem_db import save_task, get_task, get_tasks, update_task_status, list_tasks, TaskQuery
+from src.scraping.services.cache import result_cache, normalize_query
+from src.scraping.services.single_flight import SingleFlight
+from src.scraping.services.task_queue import task_queue, QueueFullError, Job
 from src.utils.decorators import task_monitor
+from src.utils.metrics import tasks_total
+from src.utils.retry import retry_policy, upstream_breaker
 
 logger = logging.getLogger(__name__)
 
+# shared by every service instance so identical in-flight scrapes run once
+scrape_flights = SingleFlight()
+# every request in these modes must run its own parse (ui opens a browser), never coalesce them
+SIDE_EFFECT_MODES = (ScrapingMode.ui,)
+_detached_tasks: set[asyncio.Task] = set()
+
+
+def run_detached(coro) -> None:
+    # keep a reference so the task is not garbage collected mid-flight
+    task = asyncio.create_task(coro)
+    _detached_tasks.add(task)
+    task.add_done_callback(_detached_tasks.discard)
+
+
+def _build_parser(mode: ScrapingMode):
+    # parser modules are imported on first use, an http-only process never loads the browser stack
+    if mode == ScrapingMode.http:
+        from src.scraping.parsers.http_parser import KinoriumHttpParser
+        return KinoriumHttpParser()
+    if mode == ScrapingMode.headless:
+        from src.scraping.parsers.details_parser import KinoriumDetailsParser
+        return KinoriumDetailsParser()
+    if mode == ScrapingMode.ui:
+        from src.scraping.parsers.ui_parser import KinoriumUIParser
+        return KinoriumUIParser()
+    return None
+
+
+# One instance per process (see `scraping_service` below), parsers are built once per mode
 class ScrapingService:
 
     def __init__(self):
-        self.parsers = {
-            ScrapingMode.http: KinoriumHttpParser(),
-            ScrapingMode.headless: KinoriumHeadlessParser(),
-            ScrapingMode.ui: KinoriumUIParser(),
-        }
+        self.parsers: dict[ScrapingMode, object] = {}
+
+    def get_parser(self, mode: ScrapingMode):
+        parser = self.parsers.get(mode)
+        if parser is None:
+            parser = _build_parser(mode)
+            if parser is not None:
+                self.parsers[mode] = parser
+        return parser
+
+    def warm_up(self, modes: list[ScrapingMode]) -> None:
+        for mode in modes:
+            self.get_parser(mode)
+
+    # one normalized query for the cache key, single-flight and the parser (genre lookup)
+    @staticmethod
+    def normalize(request: ScrapeRequest) -> ScrapeRequest:
+        return request.model_copy(update={"query": normalize_query(request.query)})
 
     async def start(self, request):
+        request = self.normalize(request)
+        task_id = self.new_task_id(request.mode)
+
+        cached_response = await self.create_task(task_id, request)
+        if cached_response:
+            return cached_response
+
+        leader = None
+        if request.mode not in SIDE_EFFECT_MODES:
+            leader = scrape_flights.join(result_cache.make_key(request.mode, request.query))
+        if leader is not None:
+            # an identical scrape is already running, wait for its result without taking a worker slot
+            run_detached(self.run_task(task_id, request, leader=leader))
+            return ScrapeResponse(task_id=task_id, status=TaskStatus.pending)
+
+        try:
+            task_queue.submit(request.mode, self.job(task_id, request), request.priority or TaskPriority.normal)
+        except QueueFullError as e:
+            await update_task_status(task_id, TaskStatus.failed, error_message=str(e))
+            raise
+
+        return ScrapeResponse(
+            task_id=task_id,
+            status=TaskStatus.pending,
+        )
+
+    def new_task_id(self, mode: ScrapingMode) -> str:
         raw_uuid = str(uuid.uuid4())
-        task_id = f"{request.mode.value}_{raw_uuid}" # just for easier identification
+        return f"{mode.value}_{raw_uuid}" # just for easier identification
+
+    # Saves the task record. Returns a completed response right away on a cache hit,
+    # otherwise the task is stored as pending and None is returned.
+    async def create_task(self, task_id: str, request: ScrapeRequest, **extra) -> ScrapeResponse | None:
+        cached_result = await result_cache.get(request.mode, request.query)
+        if cached_result is not None:
+            logger.info(f"Cache hit for task {task_id}, query: {request.query}")
+            await save_task(task_id, {
+                "task_id": task_id,
+                "status": TaskStatus.completed,
+                "mode": request.mode,
+                "query": request.query,
+                "result": cached_result,
+                "cached": True,
+                **extra,
+            })
+            tasks_total.inc(request.mode, TaskStatus.completed)
+            return ScrapeResponse(
+                task_id=task_id,
+                status=TaskStatus.completed,
+                result=cached_result,
+                cached=True,
+            )
 
         logger.info(f"Created a new scraping task with ID: {task_id}, for query: {request.query}")
         
@@ -29,19 +129,24 @@ class ScrapingService:
             "task_id": task_id,
             "status": TaskStatus.pending,
             "mode": request.mode,
-            "query": request.query
+            "query": request.query,
+            **extra,
         }
         
         await save_task(task_id, task_data) 
+        tasks_total.inc(request.mode, TaskStatus.pending)
+        return None
 
-        result = await self._process_scraping(task_id, request)
+    # Queue job for a stored task, task_queue passes in how long it waited
+    def job(self, task_id: str, request: ScrapeRequest) -> Job:
+        return lambda queue_wait: self._process_scraping(task_id, request, queue_wait=queue_wait)
 
-        return ScrapeResponse(
-            task_id=task_id,
-            status=TaskStatus.completed,
-            result=result
-        )
-        
+    # Runs a stored task to completion; failures end up in the task record, not here
+    async def run_task(self, task_id: str, request: ScrapeRequest, leader: Awaitable | None = None) -> None:
+        try:
+            await self._process_scraping(task_id, request, leader=leader)
+        except Exception:
+            pass # already logged and stored by task_monitor
 
     async def get_status(self, task_id: str) -> ScrapeResponse | None:
         task = await get_task(task_id)
@@ -49,19 +154,108 @@ class ScrapingService:
             logger.warning(f"Client requested non-existent task_id: {task_id}")
             return None
 
+        return self._to_response(task)
+
+    # Several tasks in one store read, missing ids are left out
+    async def get_statuses(self, task_ids: list[str]) -> dict[str, ScrapeResponse]:
+        tasks = await get_tasks(task_ids)
+        return {task_id: self._to_response(task) for task_id, task in tasks.items()}
+
+    @staticmethod
+    def _to_response(task: dict) -> ScrapeResponse:
         return ScrapeResponse(
             task_id=task["task_id"],
             status=task["status"],
             result=task.get("result"),
-            error_message=task.get("error_message")
+            error_message=task.get("error_message"),
+            cached=task.get("cached", False),
+            attempts=task.get("attempts"),
+            queue_wait_seconds=task.get("queue_wait_seconds"),
         )
 
 
 
+    async def list_tasks(
+        self,
+        mode: ScrapingMode | None = None,
+        status: TaskStatus | None = None,
+        query_prefix: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> TaskListResponse:
+        tasks = await list_tasks(TaskQuery(
+            # batch records share the store but are not scraping tasks
+            modes=[mode.value] if mode else [m.value for m in ScrapingMode],
+            statuses=[status.value] if status else None,
+            query_prefix=query_prefix,
+            created_after=created_after.timestamp() if created_after else None,
+            created_before=created_before.timestamp() if created_before else None,
+            cursor=self._decode_cursor(cursor) if cursor else None,
+            limit=limit,
+        ))
+
+        items = [
+            TaskSummary(
+                task_id=task["task_id"],
+                mode=task["mode"],
+                status=task["status"],
+                query=task["query"],
+                created_at=datetime.fromtimestamp(task["created_at"]).astimezone(),
+                error_message=task.get("error_message"),
+            )
+            for task in tasks
+        ]
+        next_cursor = None
+        if len(tasks) == limit:
+            next_cursor = self._encode_cursor(tasks[-1]["created_at"], tasks[-1]["task_id"])
+        return TaskListResponse(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _encode_cursor(created_at: float, task_id: str) -> str:
+        return base64.urlsafe_b64encode(json.dumps([created_at, task_id]).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[float, str]:
+        try:
+            created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(created_at), str(task_id)
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    # `leader` is an in-flight identical scrape (see SingleFlight.join) whose result is reused
     @task_monitor
-    async def _process_scraping(self, task_id: str, request: ScrapeRequest):
-        parser = self.parsers.get(request.mode)
+    async def _process_scraping(self, task_id: str, request: ScrapeRequest, leader: Awaitable | None = None):
+        if leader is None:
+            # an identical task queued earlier may have filled the cache while this one waited
+            cached_result = await result_cache.get(request.mode, request.query)
+            if cached_result is not None:
+                await update_task_status(task_id, TaskStatus.in_progress, cached=True)
+                return cached_result
+
+        parser = self.get_parser(request.mode)
         if not parser:
             raise ValueError(f"No parser found for mode: {request.mode}")
 
-        return await parser.parse(request.query)
+        async def scrape():
+            result, attempts = await retry_policy.run(lambda: parser.parse(request.query), upstream_breaker)
+            await result_cache.set(request.mode, request.query, result)
+            return result, attempts
+
+        try:
+            if leader is not None:
+                result, attempts = await leader
+            elif request.mode in SIDE_EFFECT_MODES:
+                result, attempts = await scrape()
+            else:
+                result, attempts = await scrape_flights.do(result_cache.make_key(request.mode, request.query), scrape)
+        except Exception as e:
+            await update_task_status(task_id, TaskStatus.in_progress, attempts=getattr(e, "attempts", 1))
+            raise
+
+        await update_task_status(task_id, TaskStatus.in_progress, attempts=attempts)
+        return result
+
+
+scraping_service = ScrapingService()
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+# Deduplicates concurrent calls with the same key: the first caller runs `fn`,
+# everyone arriving while it is in flight awaits the same result (or exception).
+class SingleFlight:
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    # Returns an awaitable for the in-flight call with this key, or None if there is none.
+    # Synchronous on purpose: the result stays reachable even if the call finishes before
+    # the caller gets around to awaiting it.
+    def join(self, key: str) -> Awaitable[Any] | None:
+        existing = self._calls.get(key)
+        if existing is None:
+            return None
+        self.coalesced += 1
+        logger.info(f"Joining in-flight call for '{key}'")
+        # shield so a cancelled follower does not cancel the shared call
+        return asyncio.shield(existing)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        joined = self.join(key)
+        if joined is not None:
+            return await joined
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception() # mark as retrieved when nobody joined
+            raise
+        finally:
+            del self._calls[key]
@@ -0,0 +1,48 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from src.database.base import json_serializer
+from src.database.task_events import task_events, TERMINAL_STATUSES
+from src.scraping.services.scraping_service import ScrapingService
+
+KEEPALIVE_SECONDS = 15
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=json_serializer, ensure_ascii=False)}\n\n"
+
+
+# Server-sent events for a set of tasks: the current state of each task first, then every
+# status change as it is written, until all tasks are completed/failed.
+async def stream_task_events(service: ScrapingService, task_ids: list[str]) -> AsyncIterator[str]:
+    # subscribe before reading the current state so no transition can slip in between
+    queue = task_events.subscribe(task_ids)
+    try:
+        remaining = set(task_ids)
+        for task_id in task_ids:
+            task = await service.get_status(task_id)
+            if task is None:
+                remaining.discard(task_id)
+                yield _sse("not_found", {"task_id": task_id})
+                continue
+            yield _sse("status", task.model_dump(mode="json"))
+            if task.status.value in TERMINAL_STATUSES:
+                remaining.discard(task_id)
+
+        while remaining:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if event["task_id"] not in remaining:
+                continue
+            yield _sse("status", event)
+            if event["status"] in TERMINAL_STATUSES:
+                remaining.discard(event["task_id"])
+
+        yield _sse("done", {"task_ids": task_ids})
+    finally:
+        task_events.unsubscribe(task_ids, queue)
@@ -0,0 +1,154 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable
+
+from src.config.scraping import scraping_config
+from src.scraping.schemas import ScrapingMode, TaskPriority
+from src.utils.metrics import queue_wait_seconds
+
+logger = logging.getLogger(__name__)
+
+# called with the seconds the job spent waiting in the queue
+Job = Callable[[float], Awaitable]
+
+
+class QueueFullError(Exception):
+    pass
+
+
+# Weighted fair queue for one mode. Each job gets a virtual finish tag of
+# max(now, last tag of its priority) + 1 / weight and the smallest tag runs first:
+# under load a priority with weight 8 is served 8x as often as one with weight 1,
+# a newly arrived high priority job lands ahead of a bulk backlog, and nothing starves.
+class _FairQueue:
+
+    def __init__(self, weights: dict[TaskPriority, float]):
+        self.weights = weights
+        self._heap: list[tuple[float, int, TaskPriority, float, Job]] = []
+        self._last_tag = {priority: 0.0 for priority in weights}
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, priority: TaskPriority, job: Job) -> None:
+        tag = max(self._virtual_time, self._last_tag[priority]) + 1 / self.weights[priority]
+        self._last_tag[priority] = tag
+        heapq.heappush(self._heap, (tag, next(self._seq), priority, time.monotonic(), job))
+
+    def pop(self) -> tuple[TaskPriority, float, Job]:
+        tag, _, priority, enqueued_at, job = heapq.heappop(self._heap)
+        self._virtual_time = tag
+        return priority, enqueued_at, job
+
+    def counts(self) -> dict[str, int]:
+        counts = {priority.value: 0 for priority in self.weights}
+        for entry in self._heap:
+            counts[entry[2].value] += 1
+        return counts
+
+
+# In-process job queue: a bounded weighted fair queue and a fixed set of workers per mode,
+# so at most `workers` scrapes of each kind run at once and the rest wait (or get rejected).
+class TaskQueue:
+
+    def __init__(self):
+        self.workers = {
+            ScrapingMode.http: scraping_config.http_workers,
+            ScrapingMode.headless: scraping_config.headless_workers,
+            ScrapingMode.ui: scraping_config.ui_workers,
+        }
+        self.max_size = scraping_config.queue_max_size
+        self.low_max_size = min(scraping_config.queue_low_max_size, self.max_size)
+        weights = {
+            TaskPriority.high: scraping_config.priority_weight_high,
+            TaskPriority.normal: scraping_config.priority_weight_normal,
+            TaskPriority.low: scraping_config.priority_weight_low,
+        }
+        self._queues = {mode: _FairQueue(weights) for mode in ScrapingMode}
+        self._ready = {mode: asyncio.Semaphore(0) for mode in ScrapingMode} # one permit per queued job
+        self._has_room = {mode: asyncio.Event() for mode in ScrapingMode}
+        self._in_flight = {mode: 0 for mode in ScrapingMode}
+        self._worker_tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._worker_tasks:
+            return
+        for mode, count in self.workers.items():
+            for i in range(count):
+                self._worker_tasks.append(
+                    asyncio.create_task(self._worker(mode), name=f"{mode.value}-worker-{i}")
+                )
+        logger.info(f"Task queue started with workers: { {m.value: c for m, c in self.workers.items()} }")
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks.clear()
+        logger.info("Task queue stopped")
+
+    def submit(self, mode: ScrapingMode, job: Job, priority: TaskPriority = TaskPriority.normal) -> asyncio.Future:
+        if len(self._queues[mode]) >= self._limit(priority):
+            raise QueueFullError(f"Too many pending '{mode.value}' tasks, try again later")
+
+        # resolved once the job has run (its failures are recorded by task_monitor, not here)
+        done = asyncio.get_running_loop().create_future()
+
+        async def run(queue_wait: float) -> None:
+            try:
+                await job(queue_wait)
+            finally:
+                if not done.done():
+                    done.set_result(None)
+
+        self._queues[mode].push(priority, run)
+        self._ready[mode].release()
+        return done
+
+    # Like submit, but waits for room instead of raising QueueFullError, then for the job to finish
+    async def run(self, mode: ScrapingMode, job: Job, priority: TaskPriority = TaskPriority.normal) -> None:
+        while len(self._queues[mode]) >= self._limit(priority):
+            self._has_room[mode].clear()
+            await self._has_room[mode].wait()
+        await self.submit(mode, job, priority)
+
+    # a low priority backlog never takes the headroom reserved for high and normal tasks
+    def _limit(self, priority: TaskPriority) -> int:
+        return self.low_max_size if priority == TaskPriority.low else self.max_size
+
+    def stats(self) -> dict:
+        return {
+            mode.value: {
+                "queued": len(self._queues[mode]),
+                "queued_by_priority": self._queues[mode].counts(),
+                "in_flight": self._in_flight[mode],
+                "workers": self.workers[mode],
+            }
+            for mode in ScrapingMode
+        }
+
+    async def _worker(self, mode: ScrapingMode) -> None:
+        queue = self._queues[mode]
+        while True:
+            await self._ready[mode].acquire()
+            priority, enqueued_at, job = queue.pop()
+            self._has_room[mode].set()
+            queue_wait = time.monotonic() - enqueued_at
+            queue_wait_seconds.observe(queue_wait, mode.value, priority.value)
+
+            self._in_flight[mode] += 1
+            try:
+                await job(queue_wait)
+            except Exception as e:
+                # task_monitor has already logged it and marked the task failed
+                logger.debug(f"Worker for '{mode.value}' caught: {str(e)}")
+            finally:
+                self._in_flight[mode] -= 1
+
+
+task_queue = TaskQueue()
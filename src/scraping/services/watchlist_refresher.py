@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from pathlib import Path
+
+from src.config.scraping import scraping_config
+from src.scraping.schemas import ScrapingMode, TaskPriority
+from src.scraping.services.cache import result_cache, normalize_query
+from src.scraping.services.scraping_service import scraping_service, scrape_flights
+from src.scraping.services.task_queue import task_queue
+from src.utils.retry import retry_policy, upstream_breaker
+
+logger = logging.getLogger(__name__)
+
+
+# Background job that re-scrapes the details of every title in the watchlist file and puts
+# them back into the result cache, so scrapes of watched titles are always cache hits.
+# Refreshes run as low priority jobs on task_queue's headless workers.
+# With details revalidation on, an unchanged film page costs one conditional request.
+class WatchlistRefresher:
+
+    def __init__(self, path: str | None = scraping_config.watchlist_path):
+        self.path = Path(path) if path else None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self.path is not None and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"Watchlist refresher started for {self.path}")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def load_titles(self) -> list[str]:
+        if self.path is None or not self.path.exists():
+            return []
+        titles = {}
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            title = line.strip()
+            if title and not title.startswith("#"):
+                titles.setdefault(normalize_query(title), title)
+        return list(titles.values())
+
+    async def refresh(self) -> dict:
+        titles = await asyncio.to_thread(self.load_titles)
+        parser = scraping_service.get_parser(ScrapingMode.headless)
+        semaphore = asyncio.Semaphore(scraping_config.watchlist_concurrency)
+        stats = {"refreshed": 0, "failed": 0}
+
+        async def refresh_title(title: str):
+            async def scrape():
+                details, attempts = await retry_policy.run(lambda: parser.parse(title), upstream_breaker) # type: ignore
+                await result_cache.set(ScrapingMode.headless, title, details)
+                return details, attempts
+
+            async def job(queue_wait: float):
+                try:
+                    # joins a live scrape of the same title instead of running it twice
+                    await scrape_flights.do(result_cache.make_key(ScrapingMode.headless, title), scrape)
+                    stats["refreshed"] += 1
+                except Exception as e:
+                    logger.warning(f"Watchlist refresh failed for '{title}': {str(e)}")
+                    stats["failed"] += 1
+
+            # through the headless workers at low priority, so live tasks go first
+            async with semaphore:
+                await task_queue.run(ScrapingMode.headless, job, TaskPriority.low)
+
+        await asyncio.gather(*(refresh_title(title) for title in titles))
+        return stats
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                stats = await self.refresh()
+                logger.info(f"Watchlist refresh finished: {stats}")
+            except Exception:
+                logger.exception("Watchlist refresh failed")
+            await asyncio.sleep(scraping_config.watchlist_refresh_interval)
+
+
+watchlist_refresher = WatchlistRefresher()
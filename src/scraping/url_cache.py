@@ -0,0 +1,52 @@
+import logging
+import time
+from typing import Awaitable, Callable
+
+from src.config.scraping import scraping_config
+from src.database.kv_store import SqliteKeyValueStore
+from src.scraping.parsers.movie_details import MovieNotFoundError
+from src.scraping.services.cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+
+# Persistent normalized title -> film URL mapping. Misses are cached too (with a shorter TTL),
+# so repeated lookups of unknown titles do not load the search page every time.
+class MovieUrlCache:
+
+    def __init__(self):
+        self._store = (
+            SqliteKeyValueStore(scraping_config.url_cache_path, table="movie_urls")
+            if scraping_config.url_cache_path
+            else None
+        )
+
+    async def resolve(self, movie_title: str, search: Callable[[], Awaitable[str]]) -> str:
+        if self._store is None:
+            return await search()
+
+        key = normalize_query(movie_title)
+        entry = await self._store.get(key)
+        if entry is not None:
+            url = entry[1]["url"]
+            if url is None:
+                logger.info(f"URL cache: '{movie_title}' is known to be missing")
+                raise MovieNotFoundError("Movie not found in search results")
+            logger.info(f"URL cache hit for '{movie_title}'")
+            return url
+
+        try:
+            url = await search()
+        except MovieNotFoundError:
+            await self._store.set(key, time.time() + scraping_config.url_cache_negative_ttl, {"url": None})
+            raise
+
+        await self._store.set(key, time.time() + scraping_config.url_cache_ttl, {"url": url})
+        return url
+
+    def close(self) -> None:
+        if self._store:
+            self._store.close()
+
+
+movie_url_cache = MovieUrlCache()
@@ -2,39 +2,56 @@ import functools
 import logging
 from src.database.mem_db import update_task_status  
 from src.scraping.schemas import TaskStatus
-from playwright.async_api import TimeoutError as PLawrightTimeoutError, Error as PlaywrightError
+from src.utils.metrics import tasks_total
+from src.utils.retry import is_playwright_error
 
 logger = logging.getLogger(__name__)
 
+
 # Decorator to monitor scraping tasks
 def task_monitor(func):
     @functools.wraps(func)
-    async def wrapper(self, task_id: str, request, *args, **kwargs):
+    async def wrapper(self, task_id: str, request, *args, queue_wait: float | None = None, **kwargs):
         # request -  argument that contains the scraping request details
-        
+        # queue_wait - seconds spent in task_queue, stored with the task when known
+
         logger.info(f"Task {task_id}: Started processing query='{request.query}'")
         
         try:
-            await update_task_status(task_id, TaskStatus.in_progress)
+            fields = {"queue_wait_seconds": round(queue_wait, 3)} if queue_wait is not None else {}
+            await update_task_status(task_id, TaskStatus.in_progress, **fields)
+            tasks_total.inc(request.mode, TaskStatus.in_progress)
             
             # Original function call
             result = await func(self, task_id, request, *args, **kwargs)
             
             await update_task_status(task_id, TaskStatus.completed, result=result)
+            tasks_total.inc(request.mode, TaskStatus.completed)
             logger.info(f"Task {task_id}: Completed successfully")
             return result
 
-        except (TimeoutError, ConnectionError, PLawrightTimeoutError) as e:
+        except (TimeoutError, ConnectionError) as e:
             error_msg = f"Network error: {str(e)}"
             logger.warning(f"Task {task_id}: {error_msg}")
             await update_task_status(task_id, TaskStatus.failed, error_message=error_msg)
-        except PlaywrightError as e:
-            error_msg = f"Browser error: {str(e)}"
-            logger.warning(f"Task {task_id}: {error_msg}")
-            await update_task_status(task_id, TaskStatus.failed, error_message=error_msg)
+            tasks_total.inc(request.mode, TaskStatus.failed)
 
         except Exception as e:
+            if is_playwright_error(e, "TimeoutError"):
+                error_msg = f"Network error: {str(e)}"
+            elif is_playwright_error(e):
+                error_msg = f"Browser error: {str(e)}"
+            else:
+                error_msg = None
+
+            if error_msg:
+                logger.warning(f"Task {task_id}: {error_msg}")
+                await update_task_status(task_id, TaskStatus.failed, error_message=error_msg)
+                tasks_total.inc(request.mode, TaskStatus.failed)
+                return
+
             logger.exception(f"Task {task_id}: CRITICAL FAILURE")
             await update_task_status(task_id, TaskStatus.failed, error_message=f"Internal error: {str(e)}")
+            tasks_total.inc(request.mode, TaskStatus.failed)
             raise e
     return wrapper
\ No newline at end of file
@@ -0,0 +1,127 @@
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# Minimal Prometheus text-format metrics (exposition format 0.0.4), no client library needed.
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{n}="{str(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *label_values, amount: float = 1.0) -> None:
+        key = tuple(str(getattr(v, "value", v)) for v in label_values)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, key)} {value}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values) -> None:
+        key = tuple(str(getattr(v, "value", v)) for v in label_values)
+        counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def samples(self) -> Iterator[str]:
+        for key, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}"
+            cumulative += counts[-1]
+            le = 'le="+Inf"'
+            yield f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, key)} {self._sums[key]}"
+            yield f"{self.name}_count{_format_labels(self.labels, key)} {cumulative}"
+
+
+# Gauge whose samples are read from other components at scrape time
+class CallbackGauge:
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], collect: Callable[[], dict[LabelValues, float]]):
+        self.name, self.help, self.labels, self.collect = name, help, labels, collect
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self.collect().items():
+            yield f"{self.name}{_format_labels(self.labels, key)} {value}"
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._metrics: list = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, help: str, labels: tuple[str, ...], collect: Callable[[], dict[LabelValues, float]]) -> None:
+        self.register(CallbackGauge(name, help, labels, collect))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+tasks_total = registry.register(Counter(
+    "scraper_tasks_total", "Task status transitions", ("mode", "status"),
+))
+cache_requests_total = registry.register(Counter(
+    "scraper_cache_requests_total", "Result cache lookups", ("mode", "result"),
+))
+stage_seconds = registry.register(Histogram(
+    "scraper_stage_duration_seconds", "Latency of scraping stages", ("mode", "stage"),
+))
+details_revalidations_total = registry.register(Counter(
+    "scraper_details_revalidations_total", "Film page fetches by revalidation outcome", ("outcome",),
+))
+queue_wait_seconds = registry.register(Histogram(
+    "scraper_queue_wait_seconds", "Time tasks spent in the worker queue", ("mode", "priority"),
+))
+
+
+@contextmanager
+def track_stage(mode, stage: str) -> Iterator[None]:
+    # stages: search, navigation, extraction, html_parse, storage_write
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_seconds.observe(time.perf_counter() - started, mode, stage)
+
+
+def mode_from_task_id(task_id: str) -> str:
+    return task_id.split("_", 1)[0]
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+from src.config.scraping import scraping_config
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = (429, 503)
+
+
+# Token bucket plus max-in-flight semaphore for one host. The refill rate backs off
+# multiplicatively on 429/503 and creeps back up to the configured rate on success (AIMD).
+class HostGovernor:
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = scraping_config.rate_limit_per_second,
+        burst: int = scraping_config.rate_limit_burst,
+        max_in_flight: int = scraping_config.max_in_flight_per_host,
+    ):
+        self.host = host
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(scraping_config.rate_limit_min_per_second, rate)
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+    async def _take_token(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._in_flight:
+            await self._take_token()
+            yield
+
+    def report(self, status_code: int | None, retry_after: str | None = None) -> None:
+        if status_code in THROTTLE_STATUSES:
+            self.rate = max(self.min_rate, self.rate * scraping_config.rate_limit_backoff_factor)
+            self._tokens = 0
+            pause = _parse_retry_after(retry_after)
+            if pause:
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            logger.warning(f"{self.host} answered {status_code}, slowing down to {self.rate:.2f} req/s")
+        elif status_code is not None and status_code < 400 and self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * scraping_config.rate_limit_recovery_step)
+
+    def stats(self) -> dict:
+        return {"rate": self.rate, "base_rate": self.base_rate}
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    # only the delta-seconds form, Kinorium does not send HTTP dates
+    if not value:
+        return None
+    try:
+        return min(float(value), scraping_config.request_timeout)
+    except ValueError:
+        return None
+
+
+# One governor per target host, shared by the httpx client and Playwright navigation
+class RateLimiter:
+
+    def __init__(self):
+        self._governors: dict[str, HostGovernor] = {}
+
+    def for_url(self, url: str) -> HostGovernor:
+        host = urlsplit(url).netloc
+        governor = self._governors.get(host)
+        if governor is None:
+            governor = self._governors[host] = HostGovernor(host)
+        return governor
+
+    def configure(self, url: str, **limits) -> HostGovernor:
+        # override the config defaults for one host (rate, burst, max_in_flight)
+        host = urlsplit(url).netloc
+        governor = self._governors[host] = HostGovernor(host, **limits)
+        return governor
+
+    def stats(self) -> dict:
+        return {host: governor.stats() for host, governor in self._governors.items()}
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable
+
+from src.config.scraping import scraping_config
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamHTTPError(RuntimeError):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitOpenError(ConnectionError):
+    pass
+
+
+# Matched by the classes' module so callers never have to import playwright.
+# Walks the MRO, so subclasses of playwright errors (and `name`) match too.
+def is_playwright_error(exc: BaseException, name: str | None = None) -> bool:
+    return any(
+        cls.__module__.startswith("playwright") and (name is None or cls.__name__ == name)
+        for cls in type(exc).__mro__
+    )
+
+
+# Transient = worth another attempt: timeouts, connection problems, 5xx/429.
+# Everything else (unknown genre, movie not found, parse errors) fails right away.
+def is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, UpstreamHTTPError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return is_playwright_error(exc, "TimeoutError")
+
+
+# closed -> (N transient failures in a row) -> open -> (reset_timeout) -> half-open -> one trial call
+class CircuitBreaker:
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = scraping_config.breaker_failure_threshold,
+        reset_timeout: float = scraping_config.breaker_reset_timeout,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    # Returns True when this call is the half-open trial; the caller must then record an
+    # outcome or call release_trial, otherwise the breaker stays half-open with no trial slot.
+    def before_call(self) -> bool:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            retry_in = self.reset_timeout - (time.monotonic() - self.opened_at) # type: ignore
+            raise CircuitOpenError(
+                f"{self.name} is unavailable after repeated failures, retry in {max(retry_in, 0):.0f}s"
+            )
+        if state == "half_open":
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        # the trial ended without an outcome (cancelled), let the next call try again
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info(f"Circuit '{self.name}' closed")
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            logger.warning(f"Circuit '{self.name}' opened after {self.failures} failure(s)")
+
+
+class RetryPolicy:
+
+    def __init__(
+        self,
+        max_attempts: int = scraping_config.retry_max_attempts,
+        base_delay: float = scraping_config.retry_base_delay,
+        max_delay: float = scraping_config.retry_max_delay,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        # capped exponential backoff with full jitter
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    # Returns (result, attempts). A raised exception carries the attempt count in `.attempts`.
+    async def run(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        breaker: CircuitBreaker | None = None,
+    ) -> tuple[Any, int]:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                is_trial = breaker.before_call() if breaker else False
+            except CircuitOpenError as e:
+                e.attempts = attempt # type: ignore
+                raise
+
+            try:
+                result = await fn()
+            except Exception as e:
+                transient = is_transient(e)
+                if breaker:
+                    if transient:
+                        breaker.record_failure()
+                    else:
+                        # upstream answered, the failure is ours (parse error, not found...)
+                        breaker.record_success()
+                if not transient or attempt >= self.max_attempts:
+                    e.attempts = attempt # type: ignore
+                    raise
+
+                delay = self.delay(attempt)
+                logger.warning(f"Attempt {attempt} failed ({type(e).__name__}: {str(e)}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if is_trial:
+                    breaker.release_trial() # type: ignore
+                raise
+
+            if breaker:
+                breaker.record_success()
+            return result, attempt
+
+
+retry_policy = RetryPolicy()
+upstream_breaker = CircuitBreaker("Kinorium")
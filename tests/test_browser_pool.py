@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+
+from src.scraping.browser_pool import BrowserPool, _PooledBrowser
+
+
+class FakeContext:
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeChromium:
+
+    def __init__(self):
+        self.launch_delay = 0.0
+        self.fail = False
+
+    async def launch(self, **options):
+        await asyncio.sleep(self.launch_delay)
+        if self.fail:
+            raise RuntimeError("launch failed")
+        return FakeBrowser()
+
+
+class FakePlaywright:
+
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+
+def fake_pool(size: int) -> BrowserPool:
+    pool = BrowserPool(size=size, contexts_per_browser=2, max_pages_per_browser=1, health_check_interval=60)
+    pool._playwright = FakePlaywright() # type: ignore
+    pool._browsers = [_PooledBrowser(FakeBrowser()) for _ in range(size)] # type: ignore
+    return pool
+
+
+class BrowserRecycleTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_relaunch_does_not_block_other_leases(self):
+        pool = fake_pool(2)
+        pool._playwright.chromium.launch_delay = 0.5 # type: ignore
+
+        async def lease():
+            async with pool.page():
+                pass
+
+        first = asyncio.create_task(lease())
+        await asyncio.sleep(0.05)
+        # the first browser is relaunching on release, the second one is still leasable
+        self.assertEqual(len([b for b in pool._browsers if b.retiring]), 1)
+        async with asyncio.timeout(0.2):
+            pooled = await pool._acquire()
+        self.assertFalse(pooled.retiring)
+        await first
+
+    async def test_relaunch_failure_on_release_is_logged(self):
+        pool = fake_pool(1)
+        pool._playwright.chromium.fail = True # type: ignore
+
+        with self.assertLogs("src.scraping.browser_pool", level="ERROR"):
+            async with pool.page():
+                pass
+        self.assertFalse(pool._browsers[0].retiring)
+
+
+if __name__ == "__main__":
+    unittest.main()
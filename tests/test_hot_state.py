@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.database.hot_state import HotStateTaskStore
+from src.database.sqlite_store import SqliteTaskStore
+
+
+class HotStateLockTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = HotStateTaskStore(SqliteTaskStore(str(Path(self.tmp.name) / "tasks.db")))
+
+    async def asyncTearDown(self):
+        await self.store.close()
+        self.tmp.cleanup()
+
+    async def test_updates_to_inactive_tasks_leave_no_locks(self):
+        await self.store.save_task("http_done", {"task_id": "http_done", "status": "completed", "mode": "http"})
+
+        await self.store.update_task_status("http_done", "completed", attempts=2)
+        for i in range(100):
+            await self.store.update_task_status(f"http_unknown_{i}", "failed", error_message="gone")
+
+        self.assertEqual(self.store._locks, {})
+        self.assertEqual((await self.store.get_task("http_done"))["attempts"], 2) # type: ignore
+
+    async def test_active_task_lock_dropped_on_completion(self):
+        await self.store.save_task("http_live", {"task_id": "http_live", "status": "pending", "mode": "http"})
+        await self.store.update_task_status("http_live", "in_progress")
+        self.assertIn("http_live", self.store._locks)
+
+        await self.store.update_task_status("http_live", "completed", result=[])
+        self.assertEqual(self.store._locks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import tempfile
+import unittest
+
+from src.database.json_store import JsonFileTaskStore
+
+
+class JsonStoreSaveTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = JsonFileTaskStore(self.tmp.name)
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    async def test_save_does_not_mutate_caller_dict(self):
+        task = {"task_id": "http_1", "status": "pending", "mode": "http"}
+        await self.store.save_task("http_1", task)
+
+        self.assertNotIn("created_at", task)
+        self.assertIn("created_at", await self.store.get_task("http_1")) # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
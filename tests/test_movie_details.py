@@ -0,0 +1,29 @@
+import sys
+import unittest
+from unittest import mock
+
+from src.scraping.parsers import html_backends
+from src.scraping.parsers.movie_details import extract_details_html, extract_search_href
+
+SEARCH_HTML = '<div class="search-page__list"><a class="search-page__title-link" href="/42/">Фільм</a></div>'
+DETAILS_HTML = '<h1 class="film-page__title-text">Фільм</h1><table><tr><td class="legend">Тривалість</td><td class="data">2 год</td></tr></table>'
+
+
+class WithoutLxmlTest(unittest.TestCase):
+
+    def setUp(self):
+        html_backends.soup_features.cache_clear()
+        self.addCleanup(html_backends.soup_features.cache_clear)
+
+    def test_details_parse_with_html_parser(self):
+        with mock.patch.dict(sys.modules, {"lxml": None}), self.assertLogs(html_backends.logger, "WARNING"):
+            self.assertEqual(html_backends.soup_features(), "html.parser")
+            self.assertEqual(extract_search_href(SEARCH_HTML), "/42/")
+            raw = extract_details_html(DETAILS_HTML)
+
+        self.assertEqual(raw["title"], "Фільм")
+        self.assertEqual(raw["duration"], "2 год")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.scraping.parsers.parse_pool import ParsePool
+
+
+def _die_once(html: str, marker: str) -> str:
+    # kills the worker process the first time, like a parser crashing on bad input
+    if not os.path.exists(marker):
+        Path(marker).touch()
+        os._exit(1)
+    return html.upper()
+
+
+class ParsePoolTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_recovers_from_dead_worker(self):
+        pool = ParsePool("process", workers=1, inline_max_bytes=0)
+        with tempfile.TemporaryDirectory() as tmp:
+            marker = str(Path(tmp) / "died")
+            try:
+                self.assertEqual(await pool.run(_die_once, "<html>", marker), "<HTML>")
+                # the rebuilt pool keeps serving later parses
+                self.assertEqual(await pool.run(_die_once, "<p>", marker), "<P>")
+            finally:
+                pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
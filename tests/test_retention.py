@@ -0,0 +1,49 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.database.retention import RetentionSweeper
+from src.database.sqlite_store import SqliteTaskStore
+
+DAY = 24 * 60 * 60
+
+
+class RetentionSweeperTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteTaskStore(str(Path(self.tmp.name) / "tasks.db"))
+        self.sweeper = RetentionSweeper(self.store)
+        self.sweeper.archive_dir = Path(self.tmp.name) / "archive"
+
+    async def asyncTearDown(self):
+        await self.store.close()
+        self.tmp.cleanup()
+
+    async def save_completed(self, task_id: str, age: float) -> None:
+        await self.store.save_task(task_id, {
+            "task_id": task_id,
+            "status": "completed",
+            "mode": "http",
+            "query": "драма",
+            "created_at": time.time() - age,
+            "result": [{"title": "Фільм", "link": "https://ua.kinorium.com/1/"}],
+        })
+
+    async def test_completed_task_readable_until_mode_ttl(self):
+        await self.save_completed("http_recent", 2 * DAY)
+        await self.save_completed("http_expired", self.sweeper.ttls["http"] + DAY)
+
+        stats = await self.sweeper.sweep()
+
+        task = await self.store.get_task("http_recent")
+        self.assertIsNotNone(task)
+        self.assertEqual(task["result"][0]["title"], "Фільм")
+        self.assertIsNone(await self.store.get_task("http_expired"))
+        self.assertEqual(stats["archived"], 1)
+        self.assertTrue(any(self.sweeper.archive_dir.glob("http/*.jsonl.gz")))
+
+
+if __name__ == "__main__":
+    unittest.main()
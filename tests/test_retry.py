@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from src.utils.retry import (
+    CircuitBreaker, CircuitOpenError, RetryPolicy, UpstreamHTTPError, is_playwright_error, is_transient,
+)
+
+
+def half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+    return breaker
+
+
+class CircuitBreakerTrialTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=1, base_delay=0, max_delay=0)
+
+    async def test_non_transient_error_in_trial_closes_breaker(self):
+        breaker = half_open_breaker()
+
+        async def parse_error():
+            raise ValueError("parse error")
+
+        with self.assertRaises(ValueError):
+            await self.policy.run(parse_error, breaker)
+        self.assertEqual(breaker.state, "closed")
+
+        async def ok():
+            return "ok"
+
+        self.assertEqual(await self.policy.run(ok, breaker), ("ok", 1))
+
+    async def test_cancelled_trial_releases_slot(self):
+        breaker = half_open_breaker()
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(3600)
+
+        task = asyncio.create_task(self.policy.run(hang, breaker))
+        await started.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        async def ok():
+            return "ok"
+
+        self.assertEqual(await self.policy.run(ok, breaker), ("ok", 1))
+        self.assertEqual(breaker.state, "closed")
+
+    async def test_transient_error_in_trial_reopens_breaker(self):
+        breaker = half_open_breaker()
+
+        async def unavailable():
+            raise UpstreamHTTPError("503", 503)
+
+        with self.assertRaises(UpstreamHTTPError):
+            await self.policy.run(unavailable, breaker)
+        breaker.reset_timeout = 60
+        self.assertEqual(breaker.state, "open")
+
+        async def ok():
+            return "ok"
+
+        with self.assertRaises(CircuitOpenError):
+            await self.policy.run(ok, breaker)
+
+
+class PlaywrightErrorTest(unittest.TestCase):
+
+    def test_matches_playwright_classes_and_subclasses(self):
+        # stand-ins shaped like playwright._impl._errors, so the test does not need playwright
+        Error = type("Error", (Exception,), {"__module__": "playwright._impl._errors"})
+        TimeoutError_ = type("TimeoutError", (Error,), {"__module__": "playwright._impl._errors"})
+        AppTimeout = type("AppTimeout", (TimeoutError_,), {"__module__": "src.scraping"})
+
+        self.assertTrue(is_playwright_error(Error()))
+        self.assertFalse(is_playwright_error(Error(), "TimeoutError"))
+        self.assertTrue(is_playwright_error(AppTimeout(), "TimeoutError"))
+        self.assertTrue(is_transient(AppTimeout()))
+        self.assertFalse(is_playwright_error(ValueError()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.database import mem_db
+from src.database.hot_state import HotStateTaskStore
+from src.database.sqlite_store import SqliteTaskStore
+from src.scraping.schemas import ScrapeRequest, ScrapingMode
+from src.scraping.services import scraping_service
+from src.scraping.services.scraping_service import ScrapingService
+from src.scraping.services.task_queue import TaskQueue
+
+
+class CountingParser:
+
+    def __init__(self):
+        self.calls = 0
+        self.queries: list[str] = []
+
+    async def parse(self, movie_title: str):
+        self.calls += 1
+        self.queries.append(movie_title)
+        await asyncio.sleep(0.05) # keep the requests overlapping
+        return {"opened_url": "https://ua.kinorium.com/1/"}
+
+
+class ScrapingServiceTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_store = mem_db.task_store
+        mem_db.task_store = HotStateTaskStore(SqliteTaskStore(str(Path(self.tmp.name) / "tasks.db")))
+        # a fresh queue per test, its asyncio primitives are bound to the test's event loop
+        self.queue = TaskQueue()
+        self.original_queue = scraping_service.task_queue
+        scraping_service.task_queue = self.queue
+        await self.queue.start()
+
+    async def asyncTearDown(self):
+        await self.queue.stop()
+        scraping_service.task_queue = self.original_queue
+        await mem_db.task_store.close()
+        mem_db.task_store = self.original_store
+        self.tmp.cleanup()
+
+    async def test_concurrent_identical_ui_requests_each_parse(self):
+        service = ScrapingService()
+        parser = service.parsers[ScrapingMode.ui] = CountingParser()
+
+        request = ScrapeRequest(query="Інтерстеллар", mode=ScrapingMode.ui)
+        responses = await asyncio.gather(*(service.start(request) for _ in range(4)))
+
+        for response in responses:
+            while (await service.get_status(response.task_id)).status.value not in ("completed", "failed"): # type: ignore
+                await asyncio.sleep(0.01)
+        self.assertEqual(parser.calls, 4)
+
+
+    async def test_query_normalized_for_parser_and_cache(self):
+        service = ScrapingService()
+        parser = service.parsers[ScrapingMode.http] = CountingParser()
+
+        first = await service.start(ScrapeRequest(query=" Драма  ", mode=ScrapingMode.http))
+        while (await service.get_status(first.task_id)).status.value not in ("completed", "failed"): # type: ignore
+            await asyncio.sleep(0.01)
+        second = await service.start(ScrapeRequest(query="драма", mode=ScrapingMode.http))
+
+        self.assertEqual(parser.queries, ["драма"])
+        self.assertTrue(second.cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.database.sqlite_store import SqliteTaskStore
+
+
+class JsonImportTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_legacy_json_tasks_are_imported_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            http_dir = Path(tmp) / "http"
+            http_dir.mkdir()
+            task = {
+                "task_id": "http_legacy",
+                "status": "completed",
+                "mode": "http",
+                "query": "драма",
+                "created_at": 1700000000.0,
+                "result": [{"title": "Фільм", "link": "https://ua.kinorium.com/1/"}],
+            }
+            (http_dir / "http_legacy.json").write_text(json.dumps(task, indent=4, ensure_ascii=False), encoding="utf-8")
+
+            store = SqliteTaskStore(str(Path(tmp) / "tasks.db"))
+            try:
+                self.assertEqual(await store.import_json_tasks(tmp), 1)
+                self.assertEqual(await store.get_task("http_legacy"), task)
+                self.assertEqual(await store.import_json_tasks(tmp), 0)
+            finally:
+                await store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+
+from src.scraping.schemas import ScrapingMode, TaskPriority
+from src.scraping.services.task_queue import QueueFullError, TaskQueue
+
+
+async def noop(queue_wait: float) -> None:
+    pass
+
+
+class QueueHeadroomTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # no workers are started, so everything submitted stays queued
+        self.queue = TaskQueue()
+        self.queue.max_size = 4
+        self.queue.low_max_size = 2
+
+    async def test_high_submit_accepted_while_low_backlog_is_full(self):
+        for _ in range(self.queue.low_max_size):
+            self.queue.submit(ScrapingMode.http, noop, TaskPriority.low)
+        with self.assertRaises(QueueFullError):
+            self.queue.submit(ScrapingMode.http, noop, TaskPriority.low)
+
+        self.queue.submit(ScrapingMode.http, noop, TaskPriority.high)
+        self.queue.submit(ScrapingMode.http, noop, TaskPriority.normal)
+        with self.assertRaises(QueueFullError):
+            self.queue.submit(ScrapingMode.http, noop, TaskPriority.high)
+
+    async def test_low_run_waits_for_its_own_limit(self):
+        for _ in range(self.queue.low_max_size):
+            self.queue.submit(ScrapingMode.http, noop, TaskPriority.low)
+
+        waiting = asyncio.create_task(self.queue.run(ScrapingMode.http, noop, TaskPriority.low))
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self.queue._queues[ScrapingMode.http]), self.queue.low_max_size)
+        self.queue.submit(ScrapingMode.http, noop, TaskPriority.high)
+        waiting.cancel()
+
+
+if __name__ == "__main__":
+    unittest.main()